@@ -1,150 +1,127 @@
-import re
+import sys
+from pathlib import Path
 
-# Symbol table (index order S,1 ... S,n)
-symbols = ['X', 'L1', 'NEXT', 'BACK']
-sym_addr = {'X':214, 'L1':202, 'NEXT':207, 'BACK':202}
+from ic_format import CLASSES, OPERANDS, read_ic
 
-# Literal table: map index -> {lit, addr, value}
-lit_index_to_entry = {
-    1: {"lit":"='5'", "addr":205, "value":5},
-    2: {"lit":"='2'", "addr":206, "value":2},
-    3: {"lit":"='1'", "addr":210, "value":1},
-    4: {"lit":"='2'", "addr":211, "value":2},
-    5: {"lit":"='4'", "addr":215, "value":4},
-}
+IS, AD, DL = CLASSES["IS"], CLASSES["AD"], CLASSES["DL"]
+REG, COND, C, S, L = (OPERANDS[k] for k in ("REG", "COND", "C", "S", "L"))
 
-# Intermediate code lines (use exactly as provided)
-ic_lines = [
-"(AD,01) (C,200)",
-"(IS,04) 1 (L,1)",
-"(IS,05) 1 (S,1)",
-"(IS,04) 2(L,2)",
-"(AD,03) (S,2)+3",
-"(AD,05)",
-"(L,1)",
-"(L,2)",
-"(IS,01) 1 (L,3)",
-"(IS, 02) 2 (L,4)",
-"(IS,07) 1(S,4)",
-"(AD,05)",
-"(L,3)",
-"(L,4)",
-"(AD,04) (S,2)",
-"(IS,03) 3 (L,5)",
-"(IS,00)",
-"(DL,02) (C,1)",
-"(AD,02)",
-]
+# Pass-II reads what Pass-I wrote to the current folder:
+#   IC.txt      LC<TAB>intermediate code, symbols as (S,index), literals as (L,index)
+#               (or IC.bin, the fixed-width binary form - see ic_format.py)
+#   SYMTAB.txt  Index  Symbol  Address  Defined
+#   LITTAB.txt  Index  Literal  Value  Address  Pool
+# The tables are loaded into lists indexed by the IC's (S,n) / (L,n)
+# numbers, so every operand is one list lookup. The IC is streamed one
+# record at a time and machine code is written as it is produced, so only
+# the tables are held in memory. IC.bin is read straight out of a memory
+# map with no text parsing at all.
 
-def parse_tuple(tok):
-    m = re.match(r'\(([^,]+),\s*([^\)]+)\)', tok)
-    if not m:
-        return None
-    return (m.group(1).strip(), m.group(2).strip())
+# ---------- Table loading ----------
+def load_symtab(path):
+    """Return [None, addr1, addr2, ...] so that addresses[n] resolves (S,n)."""
+    names = [None]
+    addresses = [None]
+    with open(path) as f:
+        next(f)  # header
+        for row in f:
+            fields = row.split()
+            if not fields:
+                continue
+            index, name, address = int(fields[0]), fields[1], fields[2]
+            if index != len(addresses):
+                raise Exception(f"SYMTAB out of order at index {index}")
+            names.append(name)
+            addresses.append(None if address == "None" else int(address))
+    return names, addresses
 
-machine_lines = []
-LC = None
-i = 0
-while i < len(ic_lines):
-    line = ic_lines[i].strip()
-    parts = re.findall(r'\([^\)]+\)|\S+', line)
-    first = parse_tuple(parts[0])
-    if first is None:
-        i += 1
-        continue
-    tag, val = first
-    tag = tag.strip()
+def load_littab(path):
+    """Return [None, (value, addr, pool), ...] so that literals[n] resolves (L,n)."""
+    literals = [None]
+    with open(path) as f:
+        next(f)  # header
+        for row in f:
+            fields = row.split()
+            if not fields:
+                continue
+            index, value, address, pool = int(fields[0]), fields[2], fields[3], int(fields[4])
+            if index != len(literals):
+                raise Exception(f"LITTAB out of order at index {index}")
+            literals.append((int(value), None if address == "None" else int(address), pool))
+    return literals
 
-    if tag == 'AD':
-        code = val
-        if code == '01':  # START
-            if len(parts) > 1:
-                c = parse_tuple(parts[1])
-                if c and c[0] == 'C':
-                    LC = int(c[1])
-            i += 1
-            continue
-        if code == '03':  # ORIGIN (S,n)+k
-            expr = parts[1].replace(' ', '')
-            m = re.match(r'\(S,(\d+)\)\+(\d+)', expr)
-            if m:
-                sidx = int(m.group(1)); offset = int(m.group(2))
-                sym_name = symbols[sidx-1]
-                LC = sym_addr[sym_name] + offset
-            else:
-                m2 = re.match(r'\(S,(\d+)\)', expr)
-                if m2:
-                    sidx = int(m2.group(1))
-                    LC = sym_addr[symbols[sidx-1]]
-            i += 1
-            continue
-        if code == '05':  # LTORG - literal pool marker
-            i += 1
-            continue
-        if code == '04':  # EQU -- no machine code emission in pass2 here
-            i += 1
-            continue
-        if code == '02':  # END
-            break
-        i += 1
-        continue
+# ---------- Pass-II main ----------
+def pass2(ic_path, symtab_path, littab_path, out_path):
+    names, sym_addr = load_symtab(symtab_path)
+    literals = load_littab(littab_path)
+    next_literal = 1    # first LITTAB entry not yet placed by LTORG/END
+    pool = 0            # pool closed by the next LTORG/END
+    lines_written = 0
 
-    if tag == 'IS':
-        opcode = int(val)
-        reg = None; mem = None
-        for p in parts[1:]:
-            p = p.strip()
-            if re.match(r'^\d+$', p):
-                if reg is None:
-                    reg = int(p)
-            elif p.startswith('('):
-                tup = parse_tuple(p)
-                if tup:
-                    if tup[0] == 'L':
-                        lidx = int(tup[1]); mem = lit_index_to_entry[lidx]['addr']
-                    elif tup[0] == 'S':
-                        sidx = int(tup[1]); mem = sym_addr[symbols[sidx-1]]
-                    elif tup[0] == 'C':
-                        mem = int(tup[1])
-        if LC is None:
-            LC = 0
-        machine_lines.append((LC, f"{opcode:02d} { (reg if reg is not None else 0) } { (mem if mem is not None else 0) }"))
-        LC += 1
-        i += 1
-        continue
+    def symbol_address(n):
+        if sym_addr[n] is None:
+            raise Exception(f"Undefined symbol: {names[n]}")
+        return sym_addr[n]
 
-    if tag == 'L':
-        lidx = int(val)
-        entry = lit_index_to_entry[lidx]
-        lit_address = entry['addr']; lit_value = entry['value']
-        machine_lines.append((lit_address, f"DC {lit_value}"))
-        if LC is None:
-            LC = lit_address + 1
-        else:
-            LC = max(LC, lit_address + 1)
-        i += 1
-        continue
+    with open(out_path, "w") as out:
+        def emit(addr, text):
+            nonlocal lines_written
+            out.write(f"{addr:03d} : {text}\n")
+            print(f"{addr:03d} : {text}")
+            lines_written += 1
 
-    if tag == 'DL':
-        # DL,02 (C,x) -> DC x
-        if len(parts) > 1:
-            c = parse_tuple(parts[1])
-            if c and c[0] == 'C':
-                const_val = int(c[1])
-                if LC is None:
-                    LC = 0
-                machine_lines.append((LC, f"DC {const_val}"))
-                LC += 1
-        i += 1
-        continue
+        def flush_pool():
+            # place every literal of the current pool, as Pass-I did
+            nonlocal next_literal, pool
+            while next_literal < len(literals) and literals[next_literal][2] == pool:
+                value, addr, _ = literals[next_literal]
+                emit(addr, f"DC {value}")
+                next_literal += 1
+            pool += 1
 
-    i += 1
+        for lc, cls, code, kind1, kind2, value1, value2 in read_ic(ic_path):
+            if cls == AD:
+                if code == 5:  # LTORG
+                    flush_pool()
+                elif code == 2:  # END
+                    flush_pool()
+                    break
+                # START, ORIGIN and EQU were resolved by Pass-I; the LC
+                # column already carries their effect
+                continue
 
-machine_lines_sorted = sorted(machine_lines, key=lambda x: x[0])
-for addr, text in machine_lines_sorted:
-    print(f"{addr:03d} : {text}")
+            if cls == IS:
+                reg = 0; mem = 0
+                for kind, value in ((kind1, value1), (kind2, value2)):
+                    if kind == REG or kind == COND:
+                        reg = value
+                    elif kind == L:
+                        mem = literals[value][1]
+                    elif kind == S:
+                        mem = symbol_address(value)
+                    elif kind == C:
+                        mem = value
+                emit(lc, f"{code:02d} {reg} {mem}")
+                continue
 
-# Optionally save to a file:
-with open('machine_code.txt', 'w') as f:
-    for addr, text in machine_lines_sorted:
-        f.write(f"{addr:03d} : {text}\n")
+            if cls == DL:
+                if code == 2:  # DC -> constant word
+                    emit(lc, f"DC {value1}")
+                # DS only reserves words
+                continue
+
+    return lines_written
+
+# ---------- Entry point ----------
+def main():
+    folder = Path.cwd()
+    # IC file to read: IC.txt, or IC.bin / any path given on the command line
+    ic = Path(sys.argv[1]) if len(sys.argv) > 1 else folder / "IC.txt"
+    if not ic.exists():
+        print(f"{ic.name} not found - run Pass-I first.")
+        return
+    count = pass2(ic, folder / "SYMTAB.txt", folder / "LITTAB.txt", folder / "machine_code.txt")
+    print(f"\n{count} lines written to machine_code.txt in folder:", folder)
+
+if __name__ == "__main__":
+    main()
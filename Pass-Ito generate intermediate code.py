@@ -1,7 +1,16 @@
+import argparse
+import hashlib
+import marshal
 import re
-import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from asm_lexer import (CONDITION, CONSTANT, EXPRESSION, LITERAL, REGISTER, SYMBOL, Lexer,
+                       Statement, Token)
+from ic_format import format_parts, write_binary_ic
+
 # ---------- Sample program (will be used if input.asm not found) ----------
 sample_program = """START 200
 
@@ -52,316 +61,698 @@ OPCODE = {
 # Registers mapping (for convenience)
 REG = {"AREG":1, "BREG":2, "CREG":3, "DREG":4}
 
+LEXER = Lexer(OPCODE, REG)
+
 # ---------- Data structures ----------
-SYMTAB = {}        # symbol -> {'address': int or None, 'defined': bool}
-LITTAB = []        # list of {'lit': "='5'", 'value': 5, 'address': None, 'pool':pool_index}
-POOLTAB = []       # list of indices (start index into LITTAB) for each literal pool
-INTERMEDIATE = []  # list of (LC or None, tokens_list) tokens_list is representation of IC
-
-# ---------- Helpers ----------
-def is_literal(tok):
-    return tok.startswith("=")
-
-def parse_literal(tok):
-    # parse forms: ='5' or =5
-    m = re.match(r"=\s*'(\d+)'\s*$", tok)
-    if m:
-        return int(m.group(1))
-    m2 = re.match(r"=\s*(\d+)\s*$", tok)
-    if m2:
-        return int(m2.group(1))
-    return tok  # fallback
-
-def add_literal(tok):
-    # if already present return index (1-based)
-    for idx, entry in enumerate(LITTAB, start=1):
-        if entry['lit'] == tok:
-            return idx
-    value = parse_literal(tok)
-    pool_idx = len(POOLTAB)-1 if POOLTAB else 0
-    LITTAB.append({'lit':tok, 'value':value, 'address':None, 'pool':pool_idx})
-    return len(LITTAB)
-
-def add_symbol(sym, addr=None):
-    if sym in SYMTAB:
-        if addr is not None:
-            SYMTAB[sym]['address'] = addr
-            SYMTAB[sym]['defined'] = True
+class Symbol:
+    __slots__ = ("index", "address", "defined")
+
+    def __init__(self, index, address=None):
+        self.index = index          # 1-based position in SYMTAB, used as (S,index)
+        self.address = address
+        self.defined = address is not None
+
+class Literal:
+    __slots__ = ("lit", "value", "address", "pool")
+
+    def __init__(self, lit, value, pool):
+        self.lit = lit
+        self.value = value
+        self.address = None
+        self.pool = pool
+
+# ---------- Incremental Pass-I: source blocks and cache files ----------
+# The source is cut into blocks at START / LTORG / ORIGIN lines. For each
+# block the cache keeps, under the SHA-1 of its text:
+#   * its lexed statements, so an edited file only re-lexes changed blocks;
+#   * the table delta and IC it produced, together with a signature of
+#     everything the block read on entry (which of the symbols it names
+#     exist, the address of every EQU / ORIGIN operand, and where its
+#     literals sit in the open pool). When the signature matches, the delta
+#     is replayed instead of re-running the block.
+# The delta is recorded against the LC and table sizes the block started
+# from, and is moved onto the current ones on replay: an edit that changes
+# the LC or adds symbols / literals shifts the IC LC column, the labels and
+# literal addresses, and renumbers the (S,n) / (L,n) entries of the blocks
+# after it instead of re-running them. Only blocks whose own inputs changed
+# are re-run. The entry LC stays in the signature of blocks whose results
+# do not simply move with it (see block_inputs).
+# Blocks entered or left with forward references pending (or with LC still
+# counting from an ORIGIN symbol) are always re-run, since backpatching can
+# reach back into earlier blocks.
+CACHE_VERSION = 4
+BLOCK_START = re.compile(r"^\s*(?:[A-Za-z_]\w*:?\s+)?(?:START|LTORG|ORIGIN)\b", re.IGNORECASE)
+
+def split_blocks(lines):
+    block = []
+    for line in lines:
+        if block and BLOCK_START.match(line):
+            yield block
+            block = []
+        block.append(line)
+    if block:
+        yield block
+
+def block_inputs(statements):
+    """What a block reads and changes: (names, literals, watched, defines, lc_mode).
+       names    every symbol it names
+       literals every literal it uses
+       watched  symbols whose address it reads (EQU / ORIGIN operands)
+       defines  {label: True if placed at LC, False if an EQU label}
+       lc_mode  how its results depend on the LC it is entered with:
+                "none"  not at all (it opens with an unlabelled START / ORIGIN)
+                "shift" they move with it (no START / ORIGIN, no EQU on its own labels)
+                "exact" anything else"""
+    names = set()
+    literals = set()
+    watched = set()
+    defines = {}
+    movers = []
+    for i, stmt in enumerate(statements):
+        op = stmt.mnemonic
+        if stmt.label is not None:
+            names.add(stmt.label)
+            placed = op != "EQU"
+            if defines.get(stmt.label, placed) != placed:
+                movers.append(i)  # both placed and EQU'd here: keep it exact
+            defines[stmt.label] = placed
+        if op in ("START", "ORIGIN"):
+            movers.append(i)
+        for tok in stmt.operands:
+            if tok.kind == LITERAL:
+                literals.add(tok.text)
+            elif tok.kind != CONSTANT:
+                names.add(tok.text)
+                if tok.kind == EXPRESSION:
+                    names.add(tok.value[0])
+        if op in ("EQU", "ORIGIN") and stmt.operands:
+            tok = stmt.operands[0]
+            if tok.kind == SYMBOL:
+                watched.add(tok.text)
+            elif tok.kind == EXPRESSION:
+                watched.add(tok.value[0])
+    if movers == [0] and statements[0].label is None:
+        lc_mode = "none"
+    elif movers or watched & defines.keys():
+        lc_mode = "exact"
     else:
-        SYMTAB[sym] = {'address': addr, 'defined': addr is not None}
-
-def evaluate_expression(expr):
-    # handles forms: SYMBOL +/- number OR numeric constant OR SYMBOL
-    expr = expr.strip()
-    # numeric?
-    if re.fullmatch(r'\d+', expr):
-        return int(expr)
-    # SYMBOL+num or SYMBOL-num
-    m = re.match(r'^([A-Za-z_]\w*)\s*([\+\-])\s*(\d+)$', expr)
-    if m:
-        sym = m.group(1)
-        op = m.group(2)
-        num = int(m.group(3))
-        if sym not in SYMTAB or SYMTAB[sym]['address'] is None:
-            raise Exception(f"Undefined symbol in expression: {sym}")
-        base = SYMTAB[sym]['address']
-        return base + num if op == '+' else base - num
-    # plain symbol
-    if re.fullmatch(r'[A-Za-z_]\w*', expr):
-        if expr in SYMTAB and SYMTAB[expr]['address'] is not None:
-            return SYMTAB[expr]['address']
+        lc_mode = "shift"
+    return sorted(names), sorted(literals), sorted(watched), defines, lc_mode
+
+def load_statements(path):
+    return [Statement(label, mnemonic, [Token(*tok) for tok in operands])
+            for label, mnemonic, operands in marshal.loads(path.read_bytes())]
+
+def save_statements(path, statements):
+    path.write_bytes(marshal.dumps([(stmt.label, stmt.mnemonic, [tuple(tok) for tok in stmt.operands])
+                                    for stmt in statements]))
+
+def save_if_changed(path, text):
+    """Write text to path unless the file already holds exactly that text.
+       Returns True if the file was written."""
+    try:
+        if path.read_text() == text:
+            return False
+    except OSError:
+        pass
+    path.write_text(text)
+    return True
+
+# ---------- Assembler context ----------
+class Assembler:
+    """Pass-I state for one translation unit.
+
+    Every table lives on the instance, so several units can be assembled
+    side by side (in one process or across a process pool) without
+    sharing anything.
+    """
+
+    def __init__(self):
+        self.symtab = {}         # symbol -> Symbol, in order of first appearance
+        self.littab = []         # list of Literal, e.g. Literal("='5'", 5, pool_index)
+        self.pooltab = [0]       # list of indices (start index into LITTAB) for each literal pool
+        self.intermediate = []   # list of (LC or None, tokens_list) tokens_list is representation of IC
+        self.pool_index = {}     # literal text -> LITTAB index (1-based), for the current pool only
+        self.forward = {}        # undefined symbol -> fixups to apply once it is defined
+        self.lc_base = None      # symbol LC is counted from after ORIGIN on an undefined symbol
+
+    # ---------- Helpers ----------
+    def add_literal(self, tok):
+        # if already present in the current pool return its index (1-based)
+        idx = self.pool_index.get(tok.text)
+        if idx is not None:
+            return idx
+        pool_idx = len(self.pooltab)-1 if self.pooltab else 0
+        self.littab.append(Literal(tok.text, tok.value, pool_idx))
+        self.pool_index[tok.text] = len(self.littab)
+        return len(self.littab)
+
+    def add_symbol(self, sym, addr=None):
+        if sym in self.symtab:
+            if addr is not None:
+                self.symtab[sym].address = addr
+                self.symtab[sym].defined = True
         else:
-            raise Exception(f"Undefined symbol in expression: {expr}")
-    raise Exception(f"Cannot evaluate expression: {expr}")
-
-def flush_literal_pool(LC):
-    """Assign addresses to all literals in the current pool starting at LC.
-       Returns new LC after allocation."""
-    if not POOLTAB:
-        POOLTAB.append(0)
-    start = POOLTAB[-1]
-    for i in range(start, len(LITTAB)):
-        if LITTAB[i]['address'] is None:
-            LITTAB[i]['address'] = LC
-            LC += 1
-    # start a new pool for subsequent literals
-    POOLTAB.append(len(LITTAB))
-    return LC
-
-# ---------- Parser & Pass-I main ----------
-def tokenize_line(line):
-    # remove comments (if any) after ';' and compact spaces
-    line = line.split(';',1)[0].strip()
-    # replace commas with spaces so tokens separated easily
-    # keep literals intact (they contain = and quotes)
-    # naive split: we will split on whitespace but keep tokens like "AREG," cleaned
-    tokens = re.split(r'\s+|,', line)
-    tokens = [t for t in tokens if t != '']
-    return tokens
-
-def pass1(lines):
-    LC = 0
-    # initialize first pool index
-    POOLTAB.clear()
-    POOLTAB.append(0)
-
-    i = 0
-    while i < len(lines):
-        raw = lines[i].rstrip('\n')
-        line = raw.strip()
-        i += 1
-        if not line:
-            continue
-
-        tokens = tokenize_line(line)
-        if not tokens:
-            continue
-
-        # detect label: if first token is not opcode/directive and next token is opcode OR first token ends with ':'
-        first = tokens[0].upper()
-        label = None
-        idx = 0
-
-        # If token ends with ':' treat as label (remove colon)
-        if tokens[0].endswith(':'):
-            label = tokens[0][:-1]
-            add_symbol(label, LC)
-            idx = 1
+            self.symtab[sym] = Symbol(len(self.symtab) + 1, addr)
+        if addr is not None and sym in self.forward:
+            self.backpatch(sym)
+        return self.symtab[sym].index
+
+    def evaluate_expression(self, tok):
+        """Value of an ORIGIN / EQU operand, or None while its symbol is undefined.
+           Returns (value, symbol, offset)."""
+        # handles operand tokens: SYMBOL +/- number OR numeric constant OR SYMBOL
+        if tok.kind == CONSTANT:
+            return tok.value, None, tok.value
+        if tok.kind == EXPRESSION:
+            sym, offset = tok.value
+        elif tok.kind == SYMBOL:
+            sym, offset = tok.text, 0
         else:
-            # if first token is not a known opcode or register or directive, treat as label
-            if first not in OPCODE and first not in REG and not is_literal(first):
-                # Could be label, but ensure there's an opcode afterwards
-                if len(tokens) > 1 and tokens[1].upper() in OPCODE:
-                    label = tokens[0]
-                    add_symbol(label, LC)
-                    idx = 1
-
-        if idx >= len(tokens):
-            continue
-        op = tokens[idx].upper()
-        idx += 1
-
-        # START
-        if op == "START":
-            operand = tokens[idx] if idx < len(tokens) else "0"
-            start_addr = int(operand)
-            LC = start_addr
-            INTERMEDIATE.append((None, [("AD", OPCODE["START"][1]), ("C", start_addr)]))
-            continue
-
-        # ORIGIN
-        if op == "ORIGIN":
-            expr = tokens[idx]
-            new_lc = evaluate_expression(expr)
-            INTERMEDIATE.append((None, [("AD", OPCODE["ORIGIN"][1]), ("C", new_lc)]))
-            LC = new_lc
-            continue
-
-        # EQU -> label EQU expr
-        if op == "EQU":
-            expr = tokens[idx]
-            val = evaluate_expression(expr) if not expr.isdigit() else int(expr)
-            if label:
-                add_symbol(label, val)
-                INTERMEDIATE.append((None, [("AD", OPCODE["EQU"][1]), ("C", val)]))
-            else:
-                raise Exception("EQU used without label")
-            continue
-
-        # LTORG -> flush literals now
-        if op == "LTORG":
-            INTERMEDIATE.append((None, [("AD", OPCODE["LTORG"][1])]))
-            LC = flush_literal_pool(LC)
-            continue
-
-        # END
-        if op == "END":
-            INTERMEDIATE.append((None, [("AD", OPCODE["END"][1])]))
-            LC = flush_literal_pool(LC)
-            break
-
-        # Declarative (DS / DC)
-        if op == "DS" or op == "DC":
-            # operand is size or const
-            operand = tokens[idx] if idx < len(tokens) else "1"
-            if op == "DS":
-                size = int(operand)
-                INTERMEDIATE.append((LC, [("DL", OPCODE["DS"][1]), ("C", size)]))
-                LC += size
-            else:  # DC
-                val = int(operand)
-                INTERMEDIATE.append((LC, [("DL", OPCODE["DC"][1]), ("C", val)]))
-                LC += 1
-            continue
-
-        # Imperative statements (IS)
-        if op in OPCODE and OPCODE[op][0] == "IS":
-            op_class, op_code = OPCODE[op]
-            tokens_out = [("IS", op_code)]
-
-            # parse operands remaining: could be register, symbol, literal, or condition
-            # typical forms: MOVER AREG, ='5'  OR BC LT, BACK  (BC has condition and symbol)
-            if idx < len(tokens):
-                a1 = tokens[idx].upper(); idx += 1
-                if a1 in REG:
-                    tokens_out.append(("REG", REG[a1]))
-                else:
-                    # assume condition or symbol
-                    tokens_out.append(("COND", a1))
-            if idx < len(tokens):
-                a2 = tokens[idx]
-                # literal?
-                if is_literal(a2):
-                    lit_idx = add_literal(a2)
-                    tokens_out.append(("L", lit_idx))
-                else:
-                    # symbol
-                    sym = a2
-                    add_symbol(sym, None)
-                    # find sym index? We'll keep symbolic reference as (S,sym)
-                    tokens_out.append(("S", sym))
-            INTERMEDIATE.append((LC, tokens_out))
+            raise Exception(f"Cannot evaluate expression: {tok.text}")
+        if sym not in self.symtab or self.symtab[sym].address is None:
+            return None, sym, offset
+        return self.symtab[sym].address + offset, sym, offset
+
+    # ---------- Forward references ----------
+    # A fixup (kind, offset, target) waits on one undefined symbol and is
+    # applied with value = address of that symbol + offset:
+    #   "C"    constant of the EQU / ORIGIN entry intermediate[target]
+    #   "SYM"  address of symbol `target` (an EQU label, or a label placed
+    #          while LC counts from an undefined ORIGIN symbol)
+    #   "LC"   location counter of intermediate[target]
+    #   "LIT"  address of littab[target]
+    def add_fixup(self, sym, kind, offset, target):
+        self.add_symbol(sym, None)
+        self.forward.setdefault(sym, []).append((kind, offset, target))
+
+    def place(self, LC, kind, target):
+        """Address for something placed at LC, or None (plus a fixup) while
+           LC counts from an undefined symbol."""
+        if self.lc_base is None:
+            return LC
+        self.add_fixup(self.lc_base, kind, LC, target)
+        return None
+
+    def settle_lc(self, LC):
+        """Once the ORIGIN symbol LC counts from is defined, make LC absolute again."""
+        if self.lc_base is not None and self.symtab[self.lc_base].address is not None:
+            LC += self.symtab[self.lc_base].address
+            self.lc_base = None
+        return LC
+
+    def emit(self, LC, parts):
+        self.intermediate.append((self.place(LC, "LC", len(self.intermediate)), parts))
+
+    def backpatch(self, sym):
+        """Apply every fixup waiting on sym, and on the symbols they define."""
+        pending = [sym]
+        while pending:
+            name = pending.pop()
+            fixups = self.forward.pop(name, ())
+            base = self.symtab[name].address
+            for kind, offset, target in fixups:
+                value = base + offset
+                if kind == "C":
+                    self.intermediate[target][1][1] = ("C", value)
+                elif kind == "SYM":
+                    info = self.symtab[target]
+                    info.address = value
+                    info.defined = True
+                    if target in self.forward:
+                        pending.append(target)
+                elif kind == "LC":
+                    self.intermediate[target] = (value, self.intermediate[target][1])
+                else:  # LIT
+                    self.littab[target].address = value
+
+    def unresolved(self):
+        """Describe the forward references still waiting, one string per symbol."""
+        report = []
+        for sym, fixups in self.forward.items():
+            needed = sorted({target for kind, _, target in fixups if kind == "SYM"})
+            if any(kind in ("LC", "LIT") for kind, _, _ in fixups):
+                needed.append("LC after ORIGIN")
+            report.append(f"{sym} (needed by {', '.join(needed) or 'EQU/ORIGIN'})")
+        return report
+
+    def flush_literal_pool(self, LC):
+        """Assign addresses to all literals in the current pool starting at LC.
+           Returns new LC after allocation."""
+        if not self.pooltab:
+            self.pooltab.append(0)
+        # every literal from the pool start on belongs to this pool, so each
+        # literal is visited exactly once over the whole pass
+        for i in range(self.pooltab[-1], len(self.littab)):
+            self.littab[i].address = self.place(LC, "LIT", i)
             LC += 1
-            continue
-
-        # If control reaches here, unknown token - record as-is
-        INTERMEDIATE.append((LC, [("??", op)]))
-        LC += 1
-
-    # End pass
-    return
-
-# ---------- Utility to pretty-print and save results ----------
-def print_and_save():
-    out_folder = Path.cwd()
-    # IC save
-    with open(out_folder / "IC.txt", "w") as f:
-        f.write("LC\tIntermediate\n")
-        for lc, parts in INTERMEDIATE:
-            lc_str = "" if lc is None else str(lc)
-            parts_str = []
-            for p in parts:
-                if p[0] in ("IS","AD","DL"):
-                    parts_str.append(f"({p[0]},{p[1]})")
-                elif p[0] == "C":
-                    parts_str.append(f"(C,{p[1]})")
-                elif p[0] == "REG":
-                    parts_str.append(f"(REG,{p[1]})")
-                elif p[0] == "L":
-                    parts_str.append(f"(L,{p[1]})")
-                elif p[0] == "S":
-                    parts_str.append(f"(S,{p[1]})")
-                elif p[0] == "COND":
-                    parts_str.append(f"(COND,{p[1]})")
+        # start a new pool for subsequent literals
+        self.pooltab.append(len(self.littab))
+        self.pool_index.clear()
+        return LC
+
+    # ---------- Parser & Pass-I main ----------
+    def pass1(self, lines):
+        LC = 0
+        # initialize first pool index
+        self.pooltab.clear()
+        self.pooltab.append(0)
+        self.pool_index.clear()
+
+        # one lexer call per line gives label, mnemonic and typed operands
+        statements = [stmt for stmt in map(LEXER.statement, lines) if stmt is not None]
+        self.assemble(statements, LC)
+
+    def assemble(self, statements, LC):
+        """Process lexed statements starting at LC, updating the tables.
+           Returns (LC after the last statement, True if END was reached)."""
+        for stmt in statements:
+            LC = self.settle_lc(LC)
+            label = stmt.label
+            if label is not None and stmt.mnemonic != "EQU":
+                self.add_symbol(label, self.place(LC, "SYM", label))
+            op = stmt.mnemonic
+            if op is None:
+                continue
+            operands = stmt.operands
+
+            # START
+            if op == "START":
+                start_addr = operands[0].value if operands else 0
+                LC = start_addr
+                self.lc_base = None
+                self.intermediate.append((None, [("AD", OPCODE["START"][1]), ("C", start_addr)]))
+                continue
+
+            # ORIGIN
+            if op == "ORIGIN":
+                new_lc, sym, offset = self.evaluate_expression(operands[0])
+                if new_lc is None:
+                    # symbol defined later: count LC from it and backpatch
+                    self.add_fixup(sym, "C", offset, len(self.intermediate))
+                    self.lc_base = sym
+                    new_lc = offset
                 else:
-                    parts_str.append(str(p))
-            line = f"{lc_str}\t{' '.join(parts_str)}\n"
-            f.write(line)
-
-    # SYMTAB
-    with open(out_folder / "SYMTAB.txt", "w") as f:
-        f.write("Symbol\tAddress\tDefined\n")
-        for sym, info in SYMTAB.items():
-            f.write(f"{sym}\t{info['address']}\t{info['defined']}\n")
-
-    # LITTAB
-    with open(out_folder / "LITTAB.txt", "w") as f:
-        f.write("Index\tLiteral\tValue\tAddress\tPool\n")
-        for idx, lit in enumerate(LITTAB, start=1):
-            f.write(f"{idx}\t{lit['lit']}\t{lit['value']}\t{lit['address']}\t{lit['pool']}\n")
-
-    # POOLTAB
-    with open(out_folder / "POOLTAB.txt", "w") as f:
-        f.write("PoolIndex\tLITTABStartIndex\n")
-        for idx, start in enumerate(POOLTAB):
-            f.write(f"{idx}\t{start}\n")
-
-    # Also print to console
-    print("\n=== Intermediate Code (IC.txt) ===")
-    for lc, parts in INTERMEDIATE:
-        lc_str = "" if lc is None else str(lc)
-        parts_str = []
-        for p in parts:
-            if p[0] in ("IS","AD","DL"):
-                parts_str.append(f"({p[0]},{p[1]})")
-            elif p[0] == "C":
-                parts_str.append(f"(C,{p[1]})")
-            elif p[0] == "REG":
-                parts_str.append(f"(REG,{p[1]})")
-            elif p[0] == "L":
-                parts_str.append(f"(L,{p[1]})")
-            elif p[0] == "S":
-                parts_str.append(f"(S,{p[1]})")
-            elif p[0] == "COND":
-                parts_str.append(f"(COND,{p[1]})")
-            else:
-                parts_str.append(str(p))
-        print(f"{lc_str:4} -> {' '.join(parts_str)}")
-
-    print("\n=== SYMTAB (SYMTAB.txt) ===")
-    for sym, info in SYMTAB.items():
-        print(f"{sym}\t{info['address']}\t{info['defined']}")
+                    self.lc_base = None
+                self.intermediate.append((None, [("AD", OPCODE["ORIGIN"][1]), ("C", new_lc)]))
+                LC = new_lc
+                continue
+
+            # EQU -> label EQU expr
+            if op == "EQU":
+                val, sym, offset = self.evaluate_expression(operands[0])
+                if label:
+                    if val is None:
+                        # symbol defined later: both the label and this entry are backpatched
+                        self.add_fixup(sym, "C", offset, len(self.intermediate))
+                        self.add_fixup(sym, "SYM", offset, label)
+                    self.add_symbol(label, val)
+                    self.intermediate.append((None, [("AD", OPCODE["EQU"][1]), ("C", val)]))
+                else:
+                    raise Exception("EQU used without label")
+                continue
+
+            # LTORG -> flush literals now
+            if op == "LTORG":
+                self.intermediate.append((None, [("AD", OPCODE["LTORG"][1])]))
+                LC = self.flush_literal_pool(LC)
+                continue
+
+            # END
+            if op == "END":
+                self.intermediate.append((None, [("AD", OPCODE["END"][1])]))
+                LC = self.flush_literal_pool(LC)
+                if self.forward:
+                    raise Exception("Unresolved forward references at END: " + "; ".join(self.unresolved()))
+                return LC, True
+
+            # Declarative (DS / DC)
+            if op == "DS" or op == "DC":
+                # operand is size or const
+                operand = operands[0].value if operands else 1
+                if op == "DS":
+                    self.emit(LC, [("DL", OPCODE["DS"][1]), ("C", operand)])
+                    LC += operand
+                else:  # DC
+                    self.emit(LC, [("DL", OPCODE["DC"][1]), ("C", operand)])
+                    LC += 1
+                continue
+
+            # Imperative statements (IS)
+            if op in OPCODE and OPCODE[op][0] == "IS":
+                op_class, op_code = OPCODE[op]
+                tokens_out = [("IS", op_code)]
+
+                # typical forms: MOVER AREG, ='5'  OR BC LT, BACK  (BC has condition and symbol)
+                if len(operands) > 0:
+                    a1 = operands[0]
+                    if a1.kind == REGISTER:
+                        tokens_out.append(("REG", a1.value))
+                    elif a1.kind == CONDITION:
+                        tokens_out.append(("COND", a1.value))
+                    else:
+                        # unknown condition: keep its text
+                        tokens_out.append(("COND", a1.text.upper()))
+                if len(operands) > 1:
+                    a2 = operands[1]
+                    if a2.kind == LITERAL:
+                        tokens_out.append(("L", self.add_literal(a2)))
+                    elif a2.kind == CONSTANT:
+                        tokens_out.append(("C", a2.value))
+                    else:
+                        # symbol: referenced by its SYMTAB index, (S,n)
+                        tokens_out.append(("S", self.add_symbol(a2.text, None)))
+                self.emit(LC, tokens_out)
+                LC += 1
+                continue
 
-    print("\n=== LITTAB (LITTAB.txt) ===")
-    for idx, lit in enumerate(LITTAB, start=1):
-        print(f"{idx}\t{lit['lit']}\t{lit['value']}\t{lit['address']}\t{lit['pool']}")
+            # If control reaches here, unknown token - record as-is
+            self.emit(LC, [("??", op)])
+            LC += 1
 
-    print("\n=== POOLTAB (POOLTAB.txt) ===")
-    for idx, start in enumerate(POOLTAB):
-        print(f"{idx}\t{start}")
+        # End pass
+        return self.settle_lc(LC), False
+
+    # ---------- Incremental Pass-I ----------
+    def block_base(self, LC):
+        """Where a block starts: its LC and the SYMTAB, LITTAB and POOLTAB sizes."""
+        return LC, len(self.symtab), len(self.littab), len(self.pooltab)
+
+    def block_signature(self, LC, inputs):
+        names, literals, watched, _, lc_mode = inputs
+        symtab = self.symtab
+        n_lit = len(self.littab)
+        # table sizes and SYMTAB indices are left out: what a block adds is
+        # numbered from them and renumbered on replay (see apply_delta);
+        # literals still waiting in the open pool are given relative to the
+        # end of LITTAB
+        return (LC if lc_mode == "exact" else None,
+                n_lit - self.pooltab[-1],
+                tuple(name in symtab for name in names),
+                tuple(symtab[name].address if name in symtab else None for name in watched),
+                tuple(None if i is None else i - n_lit for i in map(self.pool_index.get, literals)),
+                bool(self.forward), self.lc_base)
+
+    def run_block(self, statements, inputs, LC):
+        """Run one block through self.assemble() and record what it changed."""
+        names, _, _, defines, lc_mode = inputs
+        symtab = self.symtab
+        known = {name for name in names if name in symtab}
+        n_sym = len(symtab)
+        n_lit = len(self.littab)
+        lit_from = self.pooltab[-1]
+        n_pool = len(self.pooltab)
+        n_ic = len(self.intermediate)
+        LC, ended = self.assemble(statements, LC)
+        ic = self.intermediate[n_ic:]
+
+        # (S,n) operands naming a symbol that already existed, as
+        # (IC entry, name, n): earlier blocks may number it differently
+        by_index = {symtab[name].index: name for name in known}
+        refs = [(i, by_index[parts[-1][1]], parts[-1][1]) for i, (_, parts) in enumerate(ic)
+                if parts[-1][0] == "S" and parts[-1][1] <= n_sym]
+        # symbols only referenced here keep whatever earlier blocks gave them;
+        # (index, name, address, defined, moves with the LC)
+        symbols = sorted(((symtab[name].index, name, symtab[name].address, symtab[name].defined,
+                           lc_mode == "shift" and defines.get(name, False))
+                          for name in names
+                          if name in symtab and (name in defines or name not in known)))
+        delta = (
+            LC, ended, symbols,
+            [lit.address for lit in self.littab[lit_from:n_lit]],            # pool flushed here
+            [(lit.lit, lit.value, lit.address, lit.pool) for lit in self.littab[n_lit:]],
+            self.pooltab[n_pool:],
+            len(self.pooltab) > n_pool,                                      # flushed: index restarted
+            # only this block's own literals: earlier entries are numbered
+            # by earlier blocks and may differ on replay
+            {text: i for text, i in self.pool_index.items() if i > n_lit},
+            ic, refs,
+        )
+        return delta
+
+    def apply_delta(self, delta, recorded, base, moves):
+        """Replay a delta recorded at block_base() `recorded` at the current
+           `base`. Symbols the block created, its literals and pools are
+           renumbered by the growth of their tables, (S,n) operands naming
+           older symbols take their current index; if `moves`, everything it
+           placed at LC is moved by the LC difference as well."""
+        d_lc = base[0] - recorded[0] if moves else 0
+        n_sym = recorded[1]
+        d_sym, d_lit, d_pool = base[1] - n_sym, base[2] - recorded[2], base[3] - recorded[3]
+        LC, ended, symbols, flushed, new_literals, pools, cleared, pool_index, ic, refs = delta
+        symtab = self.symtab
+        renumbered = {i: symtab[name].index for i, name, index in refs if symtab[name].index != index}
+        for index, name, address, defined, placed in symbols:
+            info = symtab.get(name)
+            if info is None:
+                # the block created it, numbered after the n_sym it started with
+                info = symtab[name] = Symbol(index + d_sym)
+            info.address = address + d_lc if placed else address
+            info.defined = defined
+        # only blocks that move with the LC get d_lc != 0: they place
+        # everything at an absolute LC, so every address they set is a number
+        start = self.pooltab[-1]
+        for i, address in enumerate(flushed):
+            self.littab[start + i].address = address + d_lc if d_lc else address
+        for lit, value, address, pool in new_literals:
+            entry = Literal(lit, value, pool + d_pool)
+            entry.address = address + d_lc if d_lc and address is not None else address
+            self.littab.append(entry)
+        if d_lit:
+            pools = [i + d_lit for i in pools]
+            pool_index = {text: i + d_lit for text, i in pool_index.items()}
+        self.pooltab.extend(pools)
+        if cleared:
+            self.pool_index.clear()
+        self.pool_index.update(pool_index)
+        if d_lc or d_sym or d_lit or renumbered:
+            moved = []
+            for i, (lc, parts) in enumerate(ic):
+                # an (S,n) / (L,n) operand is always the last part; (L,n)
+                # names a literal of the open pool, so every one of them moves
+                kind, value = parts[-1]
+                if kind == "L" and d_lit:
+                    parts = parts[:-1] + [(kind, value + d_lit)]
+                elif kind == "S":
+                    if i in renumbered:
+                        parts = parts[:-1] + [(kind, renumbered[i])]
+                    elif d_sym and value > n_sym:
+                        parts = parts[:-1] + [(kind, value + d_sym)]
+                moved.append((lc + d_lc if d_lc and lc is not None else lc, parts))
+            ic = moved
+        self.intermediate.extend(ic)
+        return LC + d_lc, ended
+
+    def pass1_incremental(self, lines, cache_dir):
+        """Pass-I that reuses the block cache in cache_dir from earlier runs.
+           cache_dir/index holds each block's signature and delta; the lexed
+           statements live in one <hash>.lex file per block and are only read
+           when that block has to be re-run.
+           Returns (blocks replayed, blocks re-run from cached statements, blocks lexed)."""
+        cache_dir.mkdir(exist_ok=True)
+        try:
+            version, cache = marshal.loads((cache_dir / "index").read_bytes())
+            if version != CACHE_VERSION:
+                cache = {}
+        except (OSError, EOFError, ValueError, TypeError):
+            cache = {}
+
+        LC = 0
+        self.pooltab.clear()
+        self.pooltab.append(0)
+        self.pool_index.clear()
+        new_cache = {}
+        replayed = rerun = lexed = 0
+
+        for block in split_blocks(lines):
+            key = hashlib.sha1("\n".join(block).encode()).hexdigest()
+            entries = cache.get(key, [])
+            lex_file = cache_dir / f"{key}.lex"
+            if entries and lex_file.exists():
+                inputs = entries[0][0]
+                statements = None
+            else:
+                entries = []
+                statements = [stmt for stmt in map(LEXER.statement, block) if stmt is not None]
+                inputs = block_inputs(statements)
+                save_statements(lex_file, statements)
+                lexed += 1
+            signature = self.block_signature(LC, inputs)
+            base = self.block_base(LC)
+            for _, cached, recorded, delta in entries:
+                if delta is not None and cached == signature:
+                    # the delta stays as recorded; it is moved on each replay
+                    LC, ended = self.apply_delta(delta, recorded, base, inputs[-1] == "shift")
+                    replayed += 1
+                    break
+            else:
+                if statements is None:
+                    statements = load_statements(lex_file)
+                    rerun += 1
+                recorded = base
+                delta = self.run_block(statements, inputs, LC)
+                LC, ended = delta[0], delta[1]
+                if signature[-2] or self.forward or self.lc_base is not None:
+                    delta = None  # not replayable, see above
+            new_cache.setdefault(key, []).append((inputs, signature, recorded, delta))
+            if ended:
+                break
+
+        # only blocks of the current source are kept
+        if rerun or lexed or new_cache.keys() != cache.keys():
+            (cache_dir / "index").write_bytes(marshal.dumps((CACHE_VERSION, new_cache)))
+        for lex_file in cache_dir.glob("*.lex"):
+            if lex_file.stem not in new_cache:
+                lex_file.unlink()
+        return replayed, rerun, lexed
+
+    # ---------- Output ----------
+    def save(self, out_folder, binary=False):
+        """Write IC.txt, SYMTAB.txt, LITTAB.txt, POOLTAB.txt (and IC.bin) to out_folder.
+           Returns the names of the files left untouched because they did not change."""
+        # IC save
+        ic_lines = ["LC\tIntermediate\n"]
+        for lc, parts in self.intermediate:
+            lc_str = "" if lc is None else str(lc)
+            ic_lines.append(f"{lc_str}\t{format_parts(parts)}\n")
+        written = [save_if_changed(out_folder / "IC.txt", "".join(ic_lines))]
+        if binary:
+            write_binary_ic(out_folder / "IC.bin", self.intermediate)
+
+        # SYMTAB
+        rows = ["Index\tSymbol\tAddress\tDefined\n"]
+        for sym, info in self.symtab.items():
+            rows.append(f"{info.index}\t{sym}\t{info.address}\t{info.defined}\n")
+        written.append(save_if_changed(out_folder / "SYMTAB.txt", "".join(rows)))
+
+        # LITTAB
+        rows = ["Index\tLiteral\tValue\tAddress\tPool\n"]
+        for idx, lit in enumerate(self.littab, start=1):
+            rows.append(f"{idx}\t{lit.lit}\t{lit.value}\t{lit.address}\t{lit.pool}\n")
+        written.append(save_if_changed(out_folder / "LITTAB.txt", "".join(rows)))
+
+        # POOLTAB
+        rows = ["PoolIndex\tLITTABStartIndex\n"]
+        for idx, start in enumerate(self.pooltab):
+            rows.append(f"{idx}\t{start}\n")
+        written.append(save_if_changed(out_folder / "POOLTAB.txt", "".join(rows)))
+
+        return [name for name, w in zip(("IC.txt", "SYMTAB.txt", "LITTAB.txt", "POOLTAB.txt"), written) if not w]
+
+    def print_tables(self):
+        print("\n=== Intermediate Code (IC.txt) ===")
+        for lc, parts in self.intermediate:
+            lc_str = "" if lc is None else str(lc)
+            print(f"{lc_str:4} -> {format_parts(parts)}")
+
+        print("\n=== SYMTAB (SYMTAB.txt) ===")
+        for sym, info in self.symtab.items():
+            print(f"{info.index}\t{sym}\t{info.address}\t{info.defined}")
+
+        print("\n=== LITTAB (LITTAB.txt) ===")
+        for idx, lit in enumerate(self.littab, start=1):
+            print(f"{idx}\t{lit.lit}\t{lit.value}\t{lit.address}\t{lit.pool}")
+
+        print("\n=== POOLTAB (POOLTAB.txt) ===")
+        for idx, start in enumerate(self.pooltab):
+            print(f"{idx}\t{start}")
+
+# ---------- Batch driver ----------
+# One row of the batch report; error is None when the unit assembled cleanly.
+UnitResult = namedtuple("UnitResult", ["source", "out_dir", "lines", "symbols", "literals",
+                                       "ic_lines", "elapsed", "error"])
+
+def assemble_unit(job):
+    """Assemble one source file into its own output folder (runs in a worker)."""
+    source, out_dir, binary, incremental = job
+    started = time.perf_counter()
+    try:
+        lines = Path(source).read_text().splitlines()
+        out_dir.mkdir(parents=True, exist_ok=True)
+        asm = Assembler()
+        if incremental:
+            asm.pass1_incremental(lines, out_dir / ".pass1_cache")
+        else:
+            asm.pass1(lines)
+        asm.save(out_dir, binary)
+    except Exception as e:
+        return UnitResult(source, out_dir, 0, 0, 0, 0, time.perf_counter() - started, str(e))
+    return UnitResult(source, out_dir, len(lines), len(asm.symtab), len(asm.littab),
+                      len(asm.intermediate), time.perf_counter() - started, None)
+
+def assemble_batch(sources, out_root, workers=None, binary=False, incremental=False):
+    """Assemble every source file across a process pool.
+       Each unit writes to out_root/<file stem> (with a numeric suffix if two
+       sources share a stem). Returns one UnitResult per source, in order."""
+    jobs = []
+    used = set()
+    for source in sources:
+        stem = Path(source).stem
+        name, n = stem, 1
+        while name in used:
+            n += 1
+            name = f"{stem}_{n}"
+        used.add(name)
+        jobs.append((source, Path(out_root) / name, binary, incremental))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(assemble_unit, jobs))
+
+def print_batch_report(results, wall):
+    print("--------------------------------------------------------------------------")
+    print("        Source        |  Lines  | Symbols | Literals | IC Lines | Time (s)")
+    print("--------------------------------------------------------------------------")
+    for r in results:
+        name = Path(r.source).name
+        if r.error is None:
+            print(f"{name:^22}|{r.lines:^9}|{r.symbols:^9}|{r.literals:^10}|{r.ic_lines:^10}|{r.elapsed:^9.3f}")
+        else:
+            print(f"{name:^22}| FAILED: {r.error}")
+    print("--------------------------------------------------------------------------")
+    busy = sum(r.elapsed for r in results)
+    failed = sum(r.error is not None for r in results)
+    total_lines = sum(r.lines for r in results)
+    print(f"Units: {len(results)}  Failed: {failed}  Lines: {total_lines}")
+    print(f"Wall time: {wall:.3f}s  Sum of unit times: {busy:.3f}s"
+          + (f"  Parallel speedup: {busy / wall:.2f}x" if wall > 0 else ""))
+    if wall > 0:
+        print(f"Throughput: {total_lines / wall:,.0f} lines/s")
 
 # ---------- Entry point ----------
 def main():
+    parser = argparse.ArgumentParser(description="Pass-I of a two-pass assembler")
+    parser.add_argument("sources", nargs="*",
+                        help="source files to assemble in parallel (default: input.asm or the sample)")
+    parser.add_argument("--binary", action="store_true", help="also write the fixed-width IC.bin for Pass-II")
+    parser.add_argument("--incremental", action="store_true",
+                        help="reuse the block cache in the .pass1_cache folder from the last run")
+    parser.add_argument("--out", default="build", help="batch mode: folder for the per-unit outputs")
+    parser.add_argument("--workers", type=int, default=None, help="batch mode: number of processes")
+    args = parser.parse_args()
+
+    if args.sources:
+        started = time.perf_counter()
+        results = assemble_batch(args.sources, args.out, args.workers, args.binary, args.incremental)
+        print_batch_report(results, time.perf_counter() - started)
+        return
+
     inp = Path("input.asm")
     if inp.exists():
         lines = inp.read_text().splitlines()
     else:
         lines = sample_program.splitlines()
 
-    pass1(lines)
-    print_and_save()
-    print("\nFiles written: IC.txt, SYMTAB.txt, LITTAB.txt, POOLTAB.txt in folder:", Path.cwd())
+    asm = Assembler()
+    if args.incremental:
+        replayed, rerun, lexed = asm.pass1_incremental(lines, Path.cwd() / ".pass1_cache")
+        print(f"Blocks: {replayed} reused, {rerun} re-run, {lexed} lexed")
+    else:
+        asm.pass1(lines)
+    unchanged = asm.save(Path.cwd(), args.binary)
+    asm.print_tables()
+    written = "IC.txt, IC.bin" if args.binary else "IC.txt"
+    print(f"\nFiles written: {written}, SYMTAB.txt, LITTAB.txt, POOLTAB.txt in folder:", Path.cwd())
+    if unchanged:
+        print("Unchanged (not rewritten):", ", ".join(unchanged))
 
 if __name__ == "__main__":
     main()
-
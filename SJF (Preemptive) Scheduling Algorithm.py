@@ -16,6 +16,9 @@ processes = [
     {"pid": "P4", "arrival": 3, "burst": 3}
 ]
 
+# Sorting by arrival time
+processes.sort(key=lambda x: x["arrival"])
+
 n = len(processes)
 remaining_time = [p["burst"] for p in processes]
 complete = 0
@@ -26,9 +29,6 @@ check = False
 
 completion_time = [0] * n
 
-# Sorting by arrival time
-processes.sort(key=lambda x: x["arrival"])
-
 while complete != n:
     # Find process with minimum remaining time at current time
     for j in range(n):
@@ -0,0 +1,113 @@
+# Program: Assembler Lexer
+# Author: Example Solution
+# Single-pass tokenizer shared by Pass-I (source lines) and Pass-II
+# (intermediate code lines). All patterns are compiled once, here.
+
+import re
+from collections import namedtuple
+
+# Token kinds
+LABEL = "LABEL"
+MNEMONIC = "MNEMONIC"
+REGISTER = "REGISTER"
+CONDITION = "CONDITION"
+LITERAL = "LITERAL"
+SYMBOL = "SYMBOL"
+EXPRESSION = "EXPRESSION"
+CONSTANT = "CONSTANT"
+
+# kind: one of the names above, text: the source text,
+# value: register code, literal/constant value, (symbol, offset) for an
+# expression, or None
+Token = namedtuple("Token", ["kind", "text", "value"])
+
+# label: str or None, mnemonic: upper-cased str or None, operands: [Token]
+Statement = namedtuple("Statement", ["label", "mnemonic", "operands"])
+
+CONDITIONS = {"LT": 1, "LE": 2, "EQ": 3, "GT": 4, "GE": 5, "ANY": 6}
+
+_SEPARATORS = re.compile(r"[\s,]+")
+_CONSTANT = re.compile(r"(\d+)|'(\d+)'")
+_LITERAL = re.compile(r"=\s*(?:(\d+)|'(\d+)')")
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
+_EXPRESSION = re.compile(r"([A-Za-z_]\w*)\s*([+-])\s*(\d+)")
+
+# IC tokens: (TAG,value) tuples, signed offsets after a tuple, bare numbers
+_IC_TOKEN = re.compile(r"\(\s*([^,()\s]+)\s*,\s*([^()]*?)\s*\)|([+-]\s*\d+)|(\d+)")
+
+
+class Lexer:
+    """Turns assembly source lines into Statements.
+
+    `opcodes` and `registers` are the assembler's mnemonic and register
+    tables; they decide whether a leading word is a label and how operands
+    are classified.
+    """
+
+    def __init__(self, opcodes, registers):
+        self.opcodes = opcodes
+        self.registers = registers
+
+    def statement(self, line):
+        """Lex one source line; returns None for blank and comment-only lines."""
+        line = line.split(";", 1)[0]
+        words = [w for w in _SEPARATORS.split(line) if w]
+        if not words:
+            return None
+
+        label = None
+        idx = 0
+        first = words[0]
+        if first.endswith(":"):
+            # token ending with ':' is a label
+            label = first[:-1]
+            idx = 1
+        elif (first.upper() not in self.opcodes and first.upper() not in self.registers
+              and not first.startswith("=")
+              and len(words) > 1 and words[1].upper() in self.opcodes):
+            # a leading word that is not a mnemonic, followed by one
+            label = first
+            idx = 1
+
+        if idx >= len(words):
+            return Statement(label, None, [])
+        mnemonic = words[idx].upper()
+        operands = [self.operand(w) for w in words[idx + 1:]]
+        return Statement(label, mnemonic, operands)
+
+    def operand(self, word):
+        upper = word.upper()
+        if upper in self.registers:
+            return Token(REGISTER, upper, self.registers[upper])
+        if word.startswith("="):
+            m = _LITERAL.fullmatch(word)
+            return Token(LITERAL, word, int(m.group(1) or m.group(2)) if m else word)
+        m = _CONSTANT.fullmatch(word)
+        if m:
+            return Token(CONSTANT, word, int(m.group(1) or m.group(2)))
+        if upper in CONDITIONS:
+            return Token(CONDITION, upper, CONDITIONS[upper])
+        if _IDENTIFIER.fullmatch(word):
+            return Token(SYMBOL, word, None)
+        m = _EXPRESSION.fullmatch(word)
+        if m:
+            offset = int(m.group(3))
+            return Token(EXPRESSION, word, (m.group(1), offset if m.group(2) == "+" else -offset))
+        return Token(SYMBOL, word, None)
+
+
+def lex_ic_line(line):
+    """Split one intermediate code line into (tag, value) pairs.
+
+    "(IS,04) 1 (L,1)" gives [("IS", "04"), ("N", "1"), ("L", "1")]; a signed
+    offset such as the "+3" in "(S,2)+3" comes out as ("OFF", "+3").
+    """
+    parts = []
+    for tag, value, offset, number in _IC_TOKEN.findall(line):
+        if tag:
+            parts.append((tag.upper(), value))
+        elif offset:
+            parts.append(("OFF", offset.replace(" ", "")))
+        else:
+            parts.append(("N", number))
+    return parts
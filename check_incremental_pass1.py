@@ -0,0 +1,162 @@
+# Program: Incremental Pass-I Regression Check
+# Author: Example Solution
+# Re-assembles randomly edited programs with Pass-I's --incremental block
+# cache and checks every run against a full pass1() of the same source.
+
+# Usage:
+#   python check_incremental_pass1.py [programs] [seed]
+# Prints each mismatch (with the source that caused it) and exits with
+# status 1 if there was any.
+
+import random
+import runpy
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+PASS1 = Path(__file__).with_name("Pass-Ito generate intermediate code.py")
+
+# Fixed cases from bug reports: (source before, source after the edit)
+CASES = [
+    # a block without literals must not restore earlier blocks' literal numbers
+    ("START 100\nMOVER AREG, ='4'\nMOVER AREG, ='2'\nMOVER AREG, ='1'\nA DS 1\n"
+     "ORIGIN A+1\nADD AREG, X\nORIGIN A+2\nMOVER AREG, ='4'\nX DC 1\nEND",
+     "START 100\nMOVER AREG, ='1'\nMOVER AREG, ='4'\nMOVER AREG, ='2'\nA DS 1\n"
+     "ORIGIN A+1\nADD AREG, X\nORIGIN A+2\nMOVER AREG, ='4'\nX DC 1\nEND"),
+    # a block ending just after its forward ORIGIN symbol is defined
+    ("START 100\nA DS 1\nORIGIN Y+2\nB DS 1\nY EQU 500\nLTORG\nC DS 1\nEND",
+     "START 100\nA DS 1\nORIGIN Y+2\nB DS 1\nY EQU 500\nLTORG\nC DS 1\nEND"),
+    # a size change early on: later blocks are replayed shifted, not re-run
+    ("START 100\nA DS 1\nMOVER AREG, ='1'\nLTORG\nB DC 1\nADD AREG, B\n"
+     "MOVER AREG, ='2'\nE EQU A+1\nLTORG\nC DS 2\nMOVER AREG, ='3'\nEND",
+     "START 100\nA DS 6\nMOVER AREG, ='1'\nLTORG\nB DC 1\nADD AREG, B\n"
+     "MOVER AREG, ='2'\nE EQU A+1\nLTORG\nC DS 2\nMOVER AREG, ='3'\nEND"),
+]
+
+
+def snapshot(asm):
+    return ([(name, s.index, s.address, s.defined) for name, s in asm.symtab.items()],
+            [(lit.lit, lit.value, lit.address, lit.pool) for lit in asm.littab],
+            list(asm.pooltab),
+            [(lc, list(parts)) for lc, parts in asm.intermediate])
+
+
+def random_line(rng, i, labels):
+    # ORIGIN / EQU mostly name earlier labels, sometimes later ones
+    # (forward references); EQU with a constant value is mixed in too
+    def target():
+        if labels and rng.random() < 0.7:
+            return rng.choice(labels)
+        return f"L{i + rng.randint(1, 6)}"
+
+    r = rng.random()
+    if r < 0.08:
+        return "LTORG"
+    if r < 0.16:
+        return f"ORIGIN {target()}+{rng.randint(0, 3)}"
+    if r < 0.22:
+        return f"E{i} EQU {target()}{rng.choice(['', '+1', '-1'])}"
+    if r < 0.25:
+        return f"L{i} EQU {rng.randint(100, 600)}"
+    if r < 0.45:
+        return f"MOVER {rng.choice(['AREG', 'BREG'])}, ='{rng.randint(1, 4)}'"
+    if r < 0.6:
+        return f"ADD AREG, {rng.choice(['X', 'Y'])}"
+    if r < 0.8:
+        return f"L{i} DC {rng.randint(0, 9)}"
+    return f"L{i} DS {rng.randint(1, 3)}"
+
+
+def random_program(rng, n):
+    lines = ["START 100"]
+    labels = []
+    for i in range(n):
+        line = random_line(rng, i, labels)
+        lines.append(line)
+        if line.startswith(("L", "E")):
+            labels.append(line.split()[0])
+    return lines + ["X DS 1", "Y DC 3", "END"]
+
+
+def random_edit(rng, lines):
+    # the body is everything between START and the fixed X / Y / END tail
+    new = list(lines)
+    body = len(new) - 4
+    if body < 2:
+        # too short to swap or delete: grow it instead
+        new.insert(rng.randint(1, body + 1), random_line(rng, 2000 + rng.randint(0, 99), []))
+        return new
+    i = rng.randint(1, body)
+    op = rng.random()
+    if op < 0.3:
+        j = rng.randint(1, body)
+        new[i], new[j] = new[j], new[i]       # reorder, e.g. literals in a pool
+    elif op < 0.6:
+        new[i] = random_line(rng, 1000 + rng.randint(0, 99), [])
+    elif op < 0.8:
+        new.insert(i, random_line(rng, 2000 + rng.randint(0, 99), []))
+    else:
+        del new[i]
+    return new
+
+
+def main():
+    programs = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    Assembler = runpy.run_path(str(PASS1))["Assembler"]
+
+    def assembles(lines):
+        try:
+            Assembler().pass1(lines)
+            return True
+        except Exception:
+            return False
+
+    def compare(runs, cache):
+        """Assemble each source in turn with one cache; return the mismatches."""
+        bad = []
+        for lines in runs:
+            full = Assembler()
+            full.pass1(lines)
+            inc = Assembler()
+            inc.pass1_incremental(lines, cache)
+            if snapshot(full) != snapshot(inc):
+                bad.append(lines)
+        return bad
+
+    mismatches = []
+    checked = 0
+    work = Path(tempfile.mkdtemp())
+    try:
+        for k, (before, after) in enumerate(CASES):
+            runs = [before.splitlines(), after.splitlines(), after.splitlines()]
+            mismatches += compare(runs, work / f"case{k}")
+            checked += len(runs)
+
+        rng = random.Random(seed)
+        for p in range(programs):
+            lines = random_program(rng, rng.randint(5, 40))
+            if not assembles(lines):
+                continue
+            runs = [lines]
+            for _ in range(8):
+                for _ in range(20):
+                    new = random_edit(rng, runs[-1])
+                    if assembles(new):
+                        runs.append(new)
+                        break
+            mismatches += compare(runs, work / f"p{p}")
+            checked += len(runs)
+    finally:
+        shutil.rmtree(work)
+
+    for lines in mismatches:
+        print("MISMATCH for source:")
+        print("\n".join("    " + line for line in lines))
+    print(f"{checked} incremental runs, {len(mismatches)} mismatches")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+# Program: CPU Scheduling Engines
+# Author: Example Solution
+# Shared simulation core for the CPU scheduling scripts, sized for large workloads.
+
+# The process table is columnar: one array per field instead of one dict per
+# process. Each policy is a strategy function that reads the table and fills
+# in its completion (and, for non-preemptive policies, start) column;
+# simulate() then derives turnaround and waiting for every process at once.
+#
+# Processes can still be given as the scripts' dicts:
+#   {"pid": "P1", "arrival": 0, "burst": 6, "priority": 1}
+# where "priority" is only needed by priority scheduling (a lower number
+# means a higher priority).
+
+import heapq
+from array import array
+from collections import deque, namedtuple
+from operator import sub
+
+
+class ProcessTable:
+    """Columnar process table, sorted by arrival time.
+
+    pid is a list; arrival, burst, priority, start, completion, turnaround
+    and waiting are int64 arrays. Processes that arrive together keep their
+    input order. priority and start are None when not used.
+    """
+
+    def __init__(self, pid, arrival, burst, priority=None):
+        order = sorted(range(len(arrival)), key=arrival.__getitem__)
+        n = len(order)
+        self.pid = [pid[i] for i in order]
+        self.arrival = array("q", [arrival[i] for i in order])
+        self.burst = array("q", [burst[i] for i in order])
+        self.priority = None if priority is None else array("q", [priority[i] for i in order])
+        self.start = None
+        self.completion = array("q", bytes(8 * n))
+        self.turnaround = None
+        self.waiting = None
+
+    @classmethod
+    def from_dicts(cls, processes):
+        priority = None
+        if processes and "priority" in processes[0]:
+            priority = [p["priority"] for p in processes]
+        return cls([p["pid"] for p in processes],
+                   [p["arrival"] for p in processes],
+                   [p["burst"] for p in processes],
+                   priority)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def compute_metrics(self):
+        """Fill turnaround and waiting from completion, column-wise."""
+        self.turnaround = array("q", map(sub, self.completion, self.arrival))
+        self.waiting = array("q", map(sub, self.turnaround, self.burst))
+
+    def average_turnaround(self):
+        return sum(self.turnaround) / len(self)
+
+    def average_waiting(self):
+        return sum(self.waiting) / len(self)
+
+    def to_dicts(self):
+        """Return the table as the scripts' list of dicts, in arrival order."""
+        columns = ["pid", "arrival", "burst", "priority", "start",
+                   "completion", "turnaround", "waiting"]
+        columns = [c for c in columns if getattr(self, c) is not None]
+        return [dict(zip(columns, row)) for row in zip(*(getattr(self, c) for c in columns))]
+
+
+# ---------- Strategies ----------
+
+def fcfs(table):
+    """First Come First Served (non-preemptive)."""
+    start = array("q", bytes(8 * len(table)))
+    completion = table.completion
+    current_time = 0
+    for i in range(len(table)):
+        if current_time < table.arrival[i]:
+            current_time = table.arrival[i]  # wait for process to arrive
+        start[i] = current_time
+        current_time += table.burst[i]
+        completion[i] = current_time
+    table.start = start
+
+
+def srtf(table):
+    """Shortest Remaining Time First (preemptive SJF), event driven.
+
+    Instead of advancing one tick at a time, the clock jumps between
+    arrivals and completions. Ready processes wait in a min-heap keyed on
+    (remaining time, arrival order), so the whole run is O(n log n) and
+    does not depend on burst lengths.
+
+    Tie-breaking matches the tick-by-tick script: the running process is
+    only preempted by one with strictly less remaining time, and among
+    equal candidates the earliest arrival (then input order) wins.
+    """
+    arrival = table.arrival
+    burst = table.burst
+    completion = table.completion
+    n = len(table)
+
+    ready = []      # (remaining, index)
+    time = 0
+    next_arrival = 0
+    current = None  # index of the running process
+    remaining = 0   # remaining time of the running process
+    complete = 0
+
+    while complete != n:
+        if current is None:
+            if not ready and arrival[next_arrival] > time:
+                # CPU idle: jump straight to the next arrival
+                time = arrival[next_arrival]
+            while next_arrival < n and arrival[next_arrival] <= time:
+                heapq.heappush(ready, (burst[next_arrival], next_arrival))
+                next_arrival += 1
+            remaining, current = heapq.heappop(ready)
+
+        finish = time + remaining
+        if next_arrival == n or finish <= arrival[next_arrival]:
+            # Runs to completion before anything else arrives
+            time = finish
+            completion[current] = time
+            current = None
+            complete += 1
+            continue
+
+        # Run until the next arrival, then see if it should preempt
+        remaining -= arrival[next_arrival] - time
+        time = arrival[next_arrival]
+        while next_arrival < n and arrival[next_arrival] <= time:
+            heapq.heappush(ready, (burst[next_arrival], next_arrival))
+            next_arrival += 1
+        if ready[0][0] < remaining:
+            heapq.heappush(ready, (remaining, current))
+            remaining, current = heapq.heappop(ready)
+
+
+def priority_non_preemptive(table):
+    """Non-preemptive priority scheduling with a heap-backed dispatcher.
+
+    A cursor walks the arrival-sorted table and admits arrivals into a
+    min-heap keyed on (priority, arrival order); when nothing is ready the
+    clock jumps straight to the next arrival. O(n log n) overall.
+
+    Ties on priority go to the earliest arrival, then input order, which is
+    what the script's stable sort of the arrival-ordered list does.
+    """
+    if table.priority is None:
+        raise ValueError("Priority scheduling needs a priority for every process")
+    arrival = table.arrival
+    priority = table.priority
+    n = len(table)
+    start = array("q", bytes(8 * n))
+    ready = []      # (priority, index)
+    next_arrival = 0
+    current_time = 0
+
+    for _ in range(n):
+        if not ready and arrival[next_arrival] > current_time:
+            # Nothing has arrived yet: move time forward to the next arrival
+            current_time = arrival[next_arrival]
+        while next_arrival < n and arrival[next_arrival] <= current_time:
+            heapq.heappush(ready, (priority[next_arrival], next_arrival))
+            next_arrival += 1
+
+        # Start and complete the highest priority process
+        i = heapq.heappop(ready)[1]
+        start[i] = current_time
+        current_time += table.burst[i]
+        table.completion[i] = current_time
+    table.start = start
+
+
+def round_robin(table, time_quantum=2):
+    """Round Robin (preemptive) scheduling with a configurable time quantum.
+
+    Arrivals are admitted through a cursor over the arrival-sorted table,
+    so each process is looked at once on admission instead of on every
+    quantum. An empty ready queue jumps the clock to the next arrival, and
+    a process running alone runs all of its quanta up to the next arrival
+    in a single step.
+
+    Ordering matches the script: processes that arrive while a quantum
+    runs (including exactly at its end) join the queue ahead of the
+    preempted process.
+    """
+    arrival = table.arrival
+    completion = table.completion
+    n = len(table)
+    remaining_bt = array("q", table.burst)
+    ready_queue = deque()
+    next_arrival = 0
+    time = 0
+    completed = 0
+
+    while completed != n:
+        if not ready_queue:
+            # CPU idle: jump straight to the next arrival
+            time = max(time, arrival[next_arrival])
+        while next_arrival < n and arrival[next_arrival] <= time:
+            ready_queue.append(next_arrival)
+            next_arrival += 1
+
+        index = ready_queue.popleft()
+        exec_time = min(time_quantum, remaining_bt[index])
+        if not ready_queue:
+            # Running alone: keep going until a quantum ends at or after
+            # the next arrival (or the process finishes)
+            if next_arrival == n:
+                exec_time = remaining_bt[index]
+            elif arrival[next_arrival] > time + time_quantum:
+                quanta = -(-(arrival[next_arrival] - time) // time_quantum)
+                exec_time = min(quanta * time_quantum, remaining_bt[index])
+        time += exec_time
+        remaining_bt[index] -= exec_time
+
+        # Add newly arrived processes while executing
+        while next_arrival < n and arrival[next_arrival] <= time:
+            ready_queue.append(next_arrival)
+            next_arrival += 1
+
+        # If process still has burst left, push to end of queue
+        if remaining_bt[index] > 0:
+            ready_queue.append(index)
+        else:
+            completed += 1
+            completion[index] = time
+
+
+# Per-process matrices (one workload per row, same column order as the input)
+# plus per-row summary vectors
+FCFSBatch = namedtuple("FCFSBatch", [
+    "start", "completion", "turnaround", "waiting",
+    "avg_turnaround", "avg_waiting", "max_waiting", "makespan",
+])
+
+
+def fcfs_batch(arrival, burst):
+    """Evaluate FCFS on many workloads at once with NumPy.
+
+    `arrival` and `burst` are 2-D (workloads x processes) array-likes; row r
+    is one workload. Each row is stably sorted by arrival, then the FCFS
+    recurrence completion[i] = max(arrival[i], completion[i-1]) + burst[i]
+    is solved in closed form:
+
+        completion[i] = S[i] + max(0, max over j <= i of (arrival[j] - S[j-1]))
+
+    where S is the running sum of bursts, using cumsum and
+    maximum.accumulate along each row, so there is no per-process Python
+    loop. Requires NumPy.
+    """
+    import numpy as np
+
+    arrival = np.asarray(arrival, dtype=np.int64)
+    burst = np.asarray(burst, dtype=np.int64)
+    if arrival.ndim != 2 or arrival.shape != burst.shape:
+        raise ValueError("arrival and burst must be 2-D arrays of the same shape")
+
+    order = np.argsort(arrival, axis=1, kind="stable")
+    a = np.take_along_axis(arrival, order, axis=1)
+    b = np.take_along_axis(burst, order, axis=1)
+
+    total = np.cumsum(b, axis=1)
+    slack = np.maximum.accumulate(a - (total - b), axis=1)
+    completion_sorted = total + np.maximum(slack, 0)
+
+    # Scatter back to the input column order
+    completion = np.empty_like(completion_sorted)
+    np.put_along_axis(completion, order, completion_sorted, axis=1)
+    start = completion - burst
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+
+    return FCFSBatch(
+        start, completion, turnaround, waiting,
+        turnaround.mean(axis=1), waiting.mean(axis=1),
+        waiting.max(axis=1), completion.max(axis=1),
+    )
+
+
+POLICIES = {
+    "fcfs": fcfs,
+    "sjf": srtf,
+    "srtf": srtf,
+    "priority": priority_non_preemptive,
+    "rr": round_robin,
+}
+
+
+def simulate(table, policy, **options):
+    """Run `policy` (a name from POLICIES or a strategy function) on `table`.
+
+    `table` may be a ProcessTable or the scripts' list of dicts; extra
+    keyword arguments go to the strategy (e.g. time_quantum for "rr").
+    Returns the filled-in ProcessTable.
+    """
+    if not isinstance(table, ProcessTable):
+        table = ProcessTable.from_dicts(table)
+    strategy = POLICIES[policy] if isinstance(policy, str) else policy
+    strategy(table, **options)
+    table.compute_metrics()
+    return table
+
+
+def print_table(table):
+    """Print results in the same table layout as the standalone scripts.
+
+    The Priority and Start columns are shown when the table has them.
+    """
+    columns = [("pid", "Process"), ("arrival", "Arrival"), ("burst", "Burst")]
+    for key, title in (("priority", "Priority"), ("start", "Start")):
+        if getattr(table, key) is not None:
+            columns.append((key, title))
+    columns += [("completion", "Completion"), ("turnaround", "Turnaround"), ("waiting", "Waiting")]
+
+    header = " | ".join(title for _, title in columns)
+    print("-" * len(header))
+    print(header)
+    print("-" * len(header))
+    for row in zip(*(getattr(table, key) for key, _ in columns)):
+        print(" | ".join(f"{value:>{len(title)}}" for value, (_, title) in zip(row, columns)))
+    print("-" * len(header))
+    print(f"Average Turnaround Time: {table.average_turnaround():.2f}")
+    print(f"Average Waiting Time   : {table.average_waiting():.2f}")
+
+
+if __name__ == "__main__":
+    # Sample Input
+    processes = [
+        {"pid": "P1", "arrival": 0, "burst": 3},
+        {"pid": "P2", "arrival": 2, "burst": 6},
+        {"pid": "P3", "arrival": 4, "burst": 4},
+        {"pid": "P4", "arrival": 6, "burst": 5},
+        {"pid": "P5", "arrival": 8, "burst": 2}
+    ]
+
+    print("FCFS")
+    print_table(simulate(processes, "fcfs"))
+
+    processes = [
+        {"pid": "P1", "arrival": 0, "burst": 6},
+        {"pid": "P2", "arrival": 1, "burst": 4},
+        {"pid": "P3", "arrival": 4, "burst": 8},
+        {"pid": "P4", "arrival": 3, "burst": 3}
+    ]
+
+    print("\nSRTF")
+    print_table(simulate(processes, "srtf"))
+
+    print("\nRound Robin (Time Quantum = 2)")
+    print_table(simulate(processes, "rr", time_quantum=2))
+
+    processes = [
+        {"pid": "P1", "arrival": 0, "burst": 8, "priority": 1},
+        {"pid": "P2", "arrival": 0, "burst": 6, "priority": 2},
+        {"pid": "P3", "arrival": 2, "burst": 1, "priority": 3},
+        {"pid": "P4", "arrival": 3, "burst": 2, "priority": 0}
+    ]
+
+    print("\nPriority (Non-Preemptive)")
+    print_table(simulate(processes, "priority"))
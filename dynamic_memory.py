@@ -0,0 +1,271 @@
+# Program: Dynamic (Variable Partition) Memory Allocation Simulator
+# Author: Example Solution
+# Replays a stream of alloc/free events against one contiguous block of
+# memory with First, Best, Next or Worst Fit, and reports fragmentation.
+
+# Events are tuples:
+#   ("alloc", pid, size)   allocate `size` KB for process `pid`
+#   ("free", pid)          release the block held by `pid`
+#
+# Holes (free blocks) are kept in a treap ordered by address, where each
+# node also knows the largest hole in its subtree. That answers "first hole
+# at or after address a that fits" for First and Next Fit in O(log n).
+# Best and Worst Fit use a sorted (size, address) index of the same holes.
+# Freed blocks merge with the holes directly before and after them, which
+# are found through two dicts keyed on hole start and hole end.
+
+import random
+import time
+from collections import namedtuple
+
+from memory_placement import SortedList
+
+POLICIES = ("first", "best", "next", "worst")
+
+
+class _Hole:
+    __slots__ = ("addr", "size", "prio", "left", "right", "largest")
+
+    def __init__(self, addr, size):
+        self.addr = addr
+        self.size = size
+        self.prio = random.random()
+        self.left = None
+        self.right = None
+        self.largest = size
+
+
+def _fix(node):
+    largest = node.size
+    if node.left is not None and node.left.largest > largest:
+        largest = node.left.largest
+    if node.right is not None and node.right.largest > largest:
+        largest = node.right.largest
+    node.largest = largest
+
+
+def _split(node, addr):
+    """Split into (holes below addr, holes at or above addr)."""
+    if node is None:
+        return None, None
+    if node.addr < addr:
+        node.right, right = _split(node.right, addr)
+        _fix(node)
+        return node, right
+    left, node.left = _split(node.left, addr)
+    _fix(node)
+    return left, node
+
+
+def _merge(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.prio > right.prio:
+        left.right = _merge(left.right, right)
+        _fix(left)
+        return left
+    right.left = _merge(left, right.left)
+    _fix(right)
+    return right
+
+
+def _first_fit(node, lo, size):
+    """Lowest-addressed hole at address >= lo with at least `size` KB."""
+    while node is not None and node.largest >= size:
+        if node.addr < lo:
+            node = node.right
+            continue
+        found = _first_fit(node.left, lo, size)
+        if found is not None:
+            return found
+        if node.size >= size:
+            return node
+        node = node.right
+    return None
+
+
+class DynamicMemory:
+    """One contiguous block of `total` KB managed with a placement `policy`."""
+
+    def __init__(self, total, policy="first"):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown placement policy: {policy}")
+        self.total = total
+        self.policy = policy
+        self.root = None
+        self.hole_start = {}   # address -> hole size
+        self.hole_end = {}     # address just past a hole -> hole address
+        self.by_size = SortedList() if policy in ("best", "worst") else None
+        self.blocks = {}       # pid -> (address, size)
+        self.free_space = 0
+        self.rover = 0         # Next Fit: where the next search starts
+        self._add_hole(0, total)
+
+    # ---------- hole bookkeeping ----------
+    def _add_hole(self, addr, size):
+        if size <= 0:
+            return
+        left, right = _split(self.root, addr)
+        self.root = _merge(_merge(left, _Hole(addr, size)), right)
+        self.hole_start[addr] = size
+        self.hole_end[addr + size] = addr
+        if self.by_size is not None:
+            self.by_size.add((size, addr))
+        self.free_space += size
+
+    def _remove_hole(self, addr):
+        size = self.hole_start.pop(addr)
+        del self.hole_end[addr + size]
+        left, rest = _split(self.root, addr)
+        _, right = _split(rest, addr + 1)
+        self.root = _merge(left, right)
+        if self.by_size is not None:
+            self.by_size.remove((size, addr))
+        self.free_space -= size
+        return size
+
+    def _find_hole(self, size):
+        """Return the address of the hole the policy picks, or -1."""
+        if self.policy == "first":
+            node = _first_fit(self.root, 0, size)
+        elif self.policy == "next":
+            node = _first_fit(self.root, self.rover, size)
+            if node is None:
+                node = _first_fit(self.root, 0, size)  # wrap around
+        elif self.policy == "best":
+            entry = self.by_size.ceiling((size, -1))
+            return -1 if entry is None else entry[1]
+        else:  # worst
+            largest = self.by_size.last()
+            if largest is None or largest[0] < size:
+                return -1
+            return self.by_size.ceiling((largest[0], -1))[1]
+        return -1 if node is None else node.addr
+
+    # ---------- public operations ----------
+    def allocate(self, pid, size):
+        """Allocate `size` KB for `pid`; return its address or -1 if no hole fits."""
+        if pid in self.blocks:
+            raise ValueError(f"Process already holds memory: {pid}")
+        addr = self._find_hole(size)
+        if addr == -1:
+            return -1
+        hole = self._remove_hole(addr)
+        self._add_hole(addr + size, hole - size)  # leftover stays free
+        self.blocks[pid] = (addr, size)
+        self.rover = addr + size
+        return addr
+
+    def free(self, pid):
+        """Release the block held by `pid`, merging it with adjacent holes."""
+        if pid not in self.blocks:
+            raise ValueError(f"Process holds no memory: {pid}")
+        addr, size = self.blocks.pop(pid)
+        if addr in self.hole_end:
+            # hole directly before: grow it to cover this block
+            prev = self.hole_end[addr]
+            size += self._remove_hole(prev)
+            addr = prev
+        if addr + size in self.hole_start:
+            # hole directly after
+            size += self._remove_hole(addr + size)
+        self._add_hole(addr, size)
+
+    def largest_hole(self):
+        return 0 if self.root is None else self.root.largest
+
+    def hole_count(self):
+        return len(self.hole_start)
+
+    def fragmentation(self):
+        """External fragmentation: share of free memory outside the largest hole."""
+        if self.free_space == 0:
+            return 0.0
+        return 1 - self.largest_hole() / self.free_space
+
+
+# one row of the report, taken every `sample_every` events
+Sample = namedtuple("Sample", ["event", "used", "free", "holes", "largest_hole",
+                               "fragmentation", "failed"])
+SimulationResult = namedtuple("SimulationResult", ["policy", "samples", "allocated",
+                                                   "failed", "freed", "elapsed"])
+
+
+def simulate(events, total, policy="first", sample_every=1000):
+    """Replay `events` against `total` KB of memory and return a SimulationResult.
+
+    A failed allocation is counted and the process simply gets no memory; a
+    later free for it is ignored.
+    """
+    memory = DynamicMemory(total, policy)
+    samples = []
+    allocated = failed = freed = 0
+    count = 0
+    started = time.perf_counter()
+
+    for event in events:
+        count += 1
+        if event[0] == "alloc":
+            if memory.allocate(event[1], event[2]) == -1:
+                failed += 1
+            else:
+                allocated += 1
+        elif event[0] == "free":
+            if event[1] in memory.blocks:
+                memory.free(event[1])
+                freed += 1
+        else:
+            raise ValueError(f"Unknown event: {event[0]}")
+
+        if count % sample_every == 0:
+            samples.append(Sample(count, total - memory.free_space, memory.free_space,
+                                  memory.hole_count(), memory.largest_hole(),
+                                  memory.fragmentation(), failed))
+
+    if count % sample_every:
+        samples.append(Sample(count, total - memory.free_space, memory.free_space,
+                              memory.hole_count(), memory.largest_hole(),
+                              memory.fragmentation(), failed))
+    return SimulationResult(policy, samples, allocated, failed, freed,
+                            time.perf_counter() - started)
+
+
+def random_events(count, max_size, live=100, seed=0):
+    """Generate a random alloc/free churn that keeps about `live` blocks alive."""
+    rng = random.Random(seed)
+    alive = []
+    next_pid = 0
+    for _ in range(count):
+        if alive and (len(alive) >= live or rng.random() < 0.5):
+            i = rng.randrange(len(alive))
+            alive[i], alive[-1] = alive[-1], alive[i]
+            yield ("free", alive.pop())
+        else:
+            next_pid += 1
+            alive.append(next_pid)
+            yield ("alloc", next_pid, rng.randint(1, max_size))
+
+
+def print_report(result):
+    events = result.samples[-1].event if result.samples else 0
+    print(f"Policy: {result.policy} fit")
+    print("--------------------------------------------------------------------------")
+    print("  Event   |   Used   |   Free   | Holes | Largest Hole | Ext. Frag | Failed")
+    print("--------------------------------------------------------------------------")
+    for s in result.samples:
+        print(f"{s.event:^10}|{s.used:^10}|{s.free:^10}|{s.holes:^7}|{s.largest_hole:^14}|{s.fragmentation:^11.2%}|{s.failed:^7}")
+    print("--------------------------------------------------------------------------")
+    print(f"Allocated: {result.allocated}  Failed: {result.failed}  Freed: {result.freed}")
+    if result.elapsed > 0:
+        print(f"Throughput: {events / result.elapsed:,.0f} events/s")
+
+
+if __name__ == "__main__":
+    # Sample Input: 1 MB of memory, 20000 random events of up to 64 KB
+    total = 1024
+    for policy in POLICIES:
+        result = simulate(random_events(20000, 64, live=30), total, policy, sample_every=4000)
+        print_report(result)
+        print()
@@ -0,0 +1,156 @@
+# Program: Intermediate Code Formats
+# Author: Example Solution
+# Text and fixed-width binary encodings of the assembler's intermediate
+# code (IC), shared by Pass-I (writer) and Pass-II (reader).
+
+# Every IC line becomes one record:
+#   (lc, cls, code, kind1, kind2, value1, value2)
+# lc is -1 for lines without a location counter (AD directives), cls is
+# IS/AD/DL as a number, and a line carries at most two operands, each a
+# (kind, value) pair with kind 0 meaning "no operand".
+#
+# Binary IC layout (little-endian):
+#   bytes 0-3   magic b"ICBN"
+#   byte  4     format version (1)
+#   byte  5     record size in bytes (16)
+#   bytes 6-7   reserved (zero)
+#   bytes 8-    records, packed back to back as RECORD
+
+import mmap
+import struct
+import sys
+
+from asm_lexer import lex_ic_line
+
+MAGIC = b"ICBN"
+VERSION = 1
+HEADER_SIZE = 8
+RECORD = struct.Struct("<iBBBBii")
+NO_LC = -1
+
+# statement classes and operand kinds; 0 is "unknown" / "no operand"
+CLASSES = {"IS": 1, "AD": 2, "DL": 3}
+OPERANDS = {"REG": 1, "COND": 2, "C": 3, "S": 4, "L": 5}
+CLASS_NAMES = {v: k for k, v in CLASSES.items()}
+OPERAND_NAMES = {v: k for k, v in OPERANDS.items()}
+
+
+def format_parts(parts):
+    """Text form of one Pass-I IC entry, e.g. "(IS,4) (REG,1) (L,1)"."""
+    out = []
+    for p in parts:
+        if p[0] in CLASSES or p[0] in OPERANDS:
+            out.append(f"({p[0]},{p[1]})")
+        else:
+            out.append(str(p))
+    return " ".join(out)
+
+
+def encode(lc, parts):
+    """Turn one Pass-I IC entry (lc, [(tag, value), ...]) into a record."""
+    cls = CLASSES.get(parts[0][0], 0)
+    code = parts[0][1] if cls else 0
+    kinds = [0, 0]
+    values = [0, 0]
+    for i, (tag, value) in enumerate(parts[1:3]):
+        kinds[i] = OPERANDS.get(tag, 0)
+        # a condition Pass-I could not number is kept as 0
+        values[i] = value if isinstance(value, int) else 0
+    return (NO_LC if lc is None else lc, cls, code, kinds[0], kinds[1], values[0], values[1])
+
+
+def write_binary_ic(path, intermediate):
+    """Write Pass-I's INTERMEDIATE list as a binary IC file; returns the record count."""
+    buf = bytearray(HEADER_SIZE + RECORD.size * len(intermediate))
+    buf[:HEADER_SIZE] = MAGIC + bytes([VERSION, RECORD.size, 0, 0])
+    offset = HEADER_SIZE
+    pack_into = RECORD.pack_into
+    for lc, parts in intermediate:
+        pack_into(buf, offset, *encode(lc, parts))
+        offset += RECORD.size
+    with open(path, "wb") as f:
+        f.write(buf)
+    return len(intermediate)
+
+
+def map_binary_ic(path):
+    """Memory-map a binary IC file and return a read-only memoryview of its records."""
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE or header[:4] != MAGIC:
+            raise ValueError(f"Not a binary IC file: {path}")
+        if header[4] != VERSION:
+            raise ValueError(f"Unsupported IC version: {header[4]}")
+        if header[5] != RECORD.size:
+            raise ValueError(f"Unsupported IC record size: {header[5]}")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    body = memoryview(mapped)[HEADER_SIZE:]
+    if len(body) % RECORD.size:
+        raise ValueError(f"Truncated binary IC file: {path}")
+    return body
+
+
+def read_text_ic(path):
+    """Yield records from a text IC file (LC<TAB>intermediate code per line)."""
+    with open(path) as f:
+        next(f, None)  # header
+        for row in f:
+            lc_str, _, ic = row.rstrip("\n").partition("\t")
+            parts = lex_ic_line(ic)
+            if not parts:
+                continue
+            tag, value = parts[0]
+            cls = CLASSES.get(tag, 0)
+            kinds = [0, 0]
+            values = [0, 0]
+            i = 0
+            for tag, value in parts[1:]:
+                if tag == "OFF" or i == 2:
+                    continue
+                # a bare number after the mnemonic is a register / condition
+                kinds[i] = OPERANDS["REG"] if tag == "N" else OPERANDS.get(tag, 0)
+                values[i] = int(value) if value.lstrip("-").isdigit() else 0
+                i += 1
+            lc = int(lc_str) if lc_str.strip() else NO_LC
+            yield (lc, cls, int(parts[0][1]) if cls else 0, kinds[0], kinds[1], values[0], values[1])
+
+
+def read_ic(path):
+    """Yield IC records from either format, telling them apart by the magic."""
+    with open(path, "rb") as f:
+        binary = f.read(4) == MAGIC
+    if binary:
+        return RECORD.iter_unpack(map_binary_ic(path))
+    return read_text_ic(path)
+
+
+def format_record(record):
+    """Text line for one record, in the same layout as IC.txt."""
+    lc, cls, code, kind1, kind2, value1, value2 = record
+    fields = [f"({CLASS_NAMES[cls]},{code})" if cls else "(??)"]
+    if kind1:
+        fields.append(f"({OPERAND_NAMES[kind1]},{value1})")
+    if kind2:
+        fields.append(f"({OPERAND_NAMES[kind2]},{value2})")
+    return f"{'' if lc == NO_LC else lc}\t{' '.join(fields)}"
+
+
+def dump_text(records, out=sys.stdout):
+    """Write records as a human-readable IC listing."""
+    out.write("LC\tIntermediate\n")
+    for record in records:
+        out.write(format_record(record) + "\n")
+
+
+if __name__ == "__main__":
+    # Dump a binary IC file as text:
+    #   python ic_format.py IC.bin [IC.txt]
+    if len(sys.argv) < 2:
+        print("usage: python ic_format.py <binary IC> [text IC]")
+        sys.exit(1)
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], "w") as out:
+            dump_text(read_ic(sys.argv[1]), out)
+    else:
+        dump_text(read_ic(sys.argv[1]))
@@ -0,0 +1,407 @@
+# Program: Memory Placement Engines
+# Author: Example Solution
+# Reusable allocators for the fixed-partition placement scripts, sized for
+# large partition tables.
+
+# Every strategy takes the scripts' inputs (partition sizes and process
+# sizes, in KB) and returns (allocation, remaining): allocation[i] is the
+# 0-based partition given to process i or -1, and remaining is the free
+# space left in each partition. The caller's lists are not modified.
+
+import heapq
+from bisect import bisect_left, insort
+
+
+class MaxSegmentTree:
+    """Segment tree over a list of integers answering leftmost-fit queries.
+
+    find_first(size, lo) returns the smallest index >= lo whose value is at
+    least `size` (or -1), and update() changes one value; both are O(log n).
+    """
+
+    def __init__(self, values):
+        self.n = len(values)
+        size = 1
+        while size < max(self.n, 1):
+            size *= 2
+        self.size = size
+        # padding leaves hold -1 so they never fit, even a 0 KB request
+        self.tree = [-1] * (2 * size)
+        self.tree[size:size + self.n] = values
+        for i in range(size - 1, 0, -1):
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def __getitem__(self, index):
+        return self.tree[self.size + index]
+
+    def update(self, index, value):
+        tree = self.tree
+        i = self.size + index
+        tree[i] = value
+        i //= 2
+        while i:
+            left = tree[2 * i]
+            right = tree[2 * i + 1]
+            best = left if left > right else right
+            if tree[i] == best:
+                break  # ancestors are unchanged too
+            tree[i] = best
+            i //= 2
+
+    def find_first(self, size, lo=0):
+        if lo >= self.n:
+            return -1
+        tree = self.tree
+        if lo == 0:
+            if tree[1] < size:
+                return -1
+            i = 1
+        else:
+            i = self.size + lo
+            # climb until we reach a node that fits, moving right each time
+            while tree[i] < size:
+                while i & 1:
+                    i //= 2
+                if i == 0:
+                    return -1
+                i += 1
+        # descend to the leftmost leaf that fits
+        while i < self.size:
+            i *= 2
+            if tree[i] < size:
+                i += 1
+        return i - self.size
+
+
+class SortedList:
+    """Sorted list split into buckets of a few hundred items.
+
+    Lookups are two bisects (O(log n)); inserts and deletes only shift
+    items inside one bucket, so they stay cheap on millions of entries
+    where a single flat list would move the whole tail each time.
+    """
+
+    LOAD = 512
+
+    def __init__(self, items=()):
+        items = sorted(items)
+        self.buckets = [items[i:i + self.LOAD] for i in range(0, len(items), self.LOAD)]
+        self.maxes = [b[-1] for b in self.buckets]
+
+    def add(self, item):
+        if not self.buckets:
+            self.buckets.append([item])
+            self.maxes.append(item)
+            return
+        k = bisect_left(self.maxes, item)
+        if k == len(self.buckets):
+            k -= 1
+        bucket = self.buckets[k]
+        insort(bucket, item)
+        self.maxes[k] = bucket[-1]
+        if len(bucket) > 2 * self.LOAD:
+            # split an overfull bucket in two
+            self.buckets[k:k + 1] = [bucket[:self.LOAD], bucket[self.LOAD:]]
+            self.maxes[k:k + 1] = [bucket[self.LOAD - 1], bucket[-1]]
+
+    def remove(self, item):
+        k = bisect_left(self.maxes, item)
+        bucket = self.buckets[k]
+        del bucket[bisect_left(bucket, item)]
+        if bucket:
+            self.maxes[k] = bucket[-1]
+        else:
+            del self.buckets[k]
+            del self.maxes[k]
+
+    def ceiling(self, item):
+        """Return the smallest element >= item, or None."""
+        k = bisect_left(self.maxes, item)
+        if k == len(self.buckets):
+            return None
+        bucket = self.buckets[k]
+        return bucket[bisect_left(bucket, item)]
+
+    def last(self):
+        return self.buckets[-1][-1] if self.buckets else None
+
+
+def first_fit(partitions, processes):
+    """First Fit: each process goes to the lowest-numbered partition it fits.
+
+    A max segment tree over free space finds that partition and is updated
+    after the allocation, both in O(log n), so m requests over n
+    partitions cost O(m log n) instead of O(n m).
+    """
+    tree = MaxSegmentTree(list(partitions))
+    allocation = [-1] * len(processes)
+    for i, size in enumerate(processes):
+        j = tree.find_first(size)
+        if j != -1:
+            allocation[i] = j
+            tree.update(j, tree[j] - size)
+    return allocation, [tree[j] for j in range(len(partitions))]
+
+
+def next_fit(partitions, processes):
+    """Next Fit: like First Fit, but each search starts at the partition
+    used by the previous allocation and wraps around to the start.
+
+    The wrap-around search is two segment tree queries (from last_index to
+    the end, then from 0), so it is O(log n) however fragmented memory is.
+    As in the script, last_index stays on the partition just used rather
+    than moving past it.
+    """
+    tree = MaxSegmentTree(list(partitions))
+    allocation = [-1] * len(processes)
+    last_index = 0
+    for i, size in enumerate(processes):
+        j = tree.find_first(size, last_index)
+        if j == -1:
+            # nothing fits at or after last_index, so any hit is before it
+            j = tree.find_first(size)
+        if j != -1:
+            allocation[i] = j
+            tree.update(j, tree[j] - size)
+            last_index = j  # next search starts from here
+    return allocation, [tree[j] for j in range(len(partitions))]
+
+
+def best_fit(partitions, processes):
+    """Best Fit: each process goes to the smallest partition it fits.
+
+    Free space is indexed as sorted (free, partition) pairs, so the best
+    partition is a successor query and ties go to the lowest-numbered
+    partition, as in the script.
+    """
+    remaining = list(partitions)
+    index = SortedList((free, j) for j, free in enumerate(remaining))
+    allocation = [-1] * len(processes)
+    for i, size in enumerate(processes):
+        entry = index.ceiling((size, -1))
+        if entry is not None:
+            free, j = entry
+            allocation[i] = j
+            index.remove(entry)
+            remaining[j] = free - size
+            index.add((remaining[j], j))
+    return allocation, remaining
+
+
+def worst_fit(partitions, processes):
+    """Worst Fit: each process goes to the largest partition, if it fits.
+
+    Uses the same sorted (free, partition) index as best_fit(): the largest
+    free space is the last entry, and a successor query for that size picks
+    the lowest-numbered partition among equally large ones, as in the script.
+    """
+    remaining = list(partitions)
+    index = SortedList((free, j) for j, free in enumerate(remaining))
+    allocation = [-1] * len(processes)
+    for i, size in enumerate(processes):
+        largest = index.last()
+        if largest is not None and largest[0] >= size:
+            entry = index.ceiling((largest[0], -1))
+            free, j = entry
+            allocation[i] = j
+            index.remove(entry)
+            remaining[j] = free - size
+            index.add((remaining[j], j))
+    return allocation, remaining
+
+
+class BuddyAllocator:
+    """Binary buddy allocator over one region of `size` KB.
+
+    Free blocks are kept in one set of offsets per order (block size
+    2**order). A region that is not a power of two starts out as its
+    aligned power-of-two pieces (600 KB = 512 + 64 + 16 + 8). Allocation
+    rounds the request up to a power of two and splits the smallest free
+    block that is large enough; free() merges a block with its buddy for
+    as long as the buddy is free. Both are O(log size).
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.free_lists = [set() for _ in range(max(size, 1).bit_length())]
+        offset = 0
+        for order in range(len(self.free_lists) - 1, -1, -1):
+            if size & (1 << order):
+                self.free_lists[order].add(offset)
+                offset += 1 << order
+        self.free_space = size
+
+    @staticmethod
+    def order_for(size):
+        """Smallest order whose block holds `size` KB."""
+        return max(size - 1, 0).bit_length()
+
+    def largest_free(self):
+        for order in range(len(self.free_lists) - 1, -1, -1):
+            if self.free_lists[order]:
+                return 1 << order
+        return 0
+
+    def allocate(self, size):
+        """Return (offset, order) of a block holding `size` KB, or None."""
+        order = self.order_for(size)
+        for found in range(order, len(self.free_lists)):
+            if self.free_lists[found]:
+                break
+        else:
+            return None
+        offset = self.free_lists[found].pop()
+        # split down, keeping the lower half and freeing the upper buddy
+        while found > order:
+            found -= 1
+            self.free_lists[found].add(offset + (1 << found))
+        self.free_space -= 1 << order
+        return offset, order
+
+    def free(self, offset, order):
+        self.free_space += 1 << order
+        while order + 1 < len(self.free_lists):
+            buddy = offset ^ (1 << order)
+            if buddy not in self.free_lists[order]:
+                break
+            self.free_lists[order].remove(buddy)
+            offset = min(offset, buddy)
+            order += 1
+        self.free_lists[order].add(offset)
+
+
+def buddy_fit(partitions, processes):
+    """Buddy system: every partition is run as a binary buddy allocator.
+
+    A process goes to the lowest-numbered partition whose largest free
+    buddy block can hold it, found with a MaxSegmentTree over each
+    partition's largest free block (O(log n)), and then takes a
+    power-of-two block there (O(log size)). Remaining space counts the
+    rounding, so internal fragmentation shows up in the results. A 0 KB
+    request takes no block, as in segregated_fit().
+    """
+    buddies = [BuddyAllocator(size) for size in partitions]
+    tree = MaxSegmentTree([b.largest_free() for b in buddies])
+    allocation = [-1] * len(processes)
+    for i, size in enumerate(processes):
+        if size <= 0:
+            if buddies:
+                allocation[i] = 0  # fits anywhere and uses nothing
+            continue
+        j = tree.find_first(1 << BuddyAllocator.order_for(size))
+        if j != -1:
+            buddies[j].allocate(size)
+            allocation[i] = j
+            tree.update(j, buddies[j].largest_free())
+    return allocation, [b.free_space for b in buddies]
+
+
+def segregated_fit(partitions, processes):
+    """Segregated free lists: partitions are grouped into power-of-two size
+    classes by their free space (class k holds free space in [2**k, 2**(k+1))).
+
+    A request takes the lowest-numbered partition from the smallest class
+    whose partitions are all guaranteed to fit; each class is a heap of
+    partition numbers, making that O(log n). Only when all of those
+    classes are empty can a fitting partition be in the request's own
+    class, and since every larger class is empty then, the leftmost-fit
+    query of a MaxSegmentTree over free space finds it in O(log n) too.
+    """
+    remaining = list(partitions)
+    tree = MaxSegmentTree(list(remaining))
+    classes = [[] for _ in range(max(remaining, default=0).bit_length())]
+    for j, free in enumerate(remaining):
+        if free > 0:
+            classes[free.bit_length() - 1].append(j)
+    allocation = [-1] * len(processes)
+
+    def in_class(j, k):
+        # heap entries are dropped lazily: a partition whose free space fell
+        # below class k never returns to it
+        return remaining[j].bit_length() - 1 == k
+
+    for i, size in enumerate(processes):
+        if size <= 0:
+            if remaining:
+                allocation[i] = 0  # fits anywhere and uses nothing
+            continue
+
+        j = -1
+        start = (size - 1).bit_length()  # classes from here up always fit
+        for k in range(start, len(classes)):
+            heap = classes[k]
+            while heap and not in_class(heap[0], k):
+                heapq.heappop(heap)
+            if heap:
+                j = heapq.heappop(heap)
+                break
+        else:
+            # the only partitions left that may fit are in the own class;
+            # j stays in its heap (it is still there, or stale once it moves down)
+            j = tree.find_first(size)
+            if j == -1:
+                continue
+            remaining[j] -= size
+            tree.update(j, remaining[j])
+            allocation[i] = j
+            if remaining[j] > 0 and not in_class(j, size.bit_length() - 1):
+                heapq.heappush(classes[remaining[j].bit_length() - 1], j)
+            continue
+        if j == -1:
+            continue
+
+        allocation[i] = j
+        remaining[j] -= size
+        tree.update(j, remaining[j])
+        if remaining[j] > 0:
+            heapq.heappush(classes[remaining[j].bit_length() - 1], j)
+    return allocation, remaining
+
+
+STRATEGIES = {
+    "first": first_fit,
+    "next": next_fit,
+    "best": best_fit,
+    "worst": worst_fit,
+    "buddy": buddy_fit,
+    "segregated": segregated_fit,
+}
+
+
+def print_allocation(processes, allocation, remaining):
+    """Print results in the same table layout as the standalone scripts."""
+    print("------------------------------------------------------------")
+    print("Process No | Process Size | Partition Allocated | Remaining Space")
+    print("------------------------------------------------------------")
+    for i in range(len(processes)):
+        if allocation[i] != -1:
+            print(f"{i+1:^11}|{processes[i]:^14}|{allocation[i]+1:^20}|{remaining[allocation[i]]:^16}")
+        else:
+            print(f"{i+1:^11}|{processes[i]:^14}|{'Not Allocated':^20}|{'-':^16}")
+    print("------------------------------------------------------------")
+
+
+if __name__ == "__main__":
+    # Memory partitions (in KB)
+    partitions = [100, 500, 200, 300, 600]
+
+    # Processes (in KB)
+    processes = [212, 417, 112, 426]
+
+    print("First Fit")
+    print_allocation(processes, *first_fit(partitions, processes))
+
+    print("\nNext Fit")
+    print_allocation(processes, *next_fit(partitions, processes))
+
+    print("\nBest Fit")
+    print_allocation(processes, *best_fit(partitions, processes))
+
+    print("\nWorst Fit")
+    print_allocation(processes, *worst_fit(partitions, processes))
+
+    print("\nBuddy System")
+    print_allocation(processes, *buddy_fit(partitions, processes))
+
+    print("\nSegregated Free Lists")
+    print_allocation(processes, *segregated_fit(partitions, processes))
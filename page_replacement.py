@@ -0,0 +1,420 @@
+# Program: Page Replacement Engines
+# Author: Example Solution
+# Reusable simulators for the page replacement scripts, sized for long traces.
+# `pages` can be any iterable of page numbers: a list, a generator from
+# reference_trace.read_text_trace() or a memoryview from map_binary_trace().
+#
+# Per-reference tracing is optional and costs nothing when it is off:
+#   * log=True keeps (page, frames, fault) for every reference in memory
+#     and returns it in PageResult.log (small inputs only);
+#   * tracer=FileTracer(...) streams every reference (full) or every k-th
+#     reference (sampled) to a CSV or binary file through a large buffer.
+# make_tracer() builds the right one for the "off", "sampled" and "full"
+# levels.
+
+import heapq
+import struct
+import sys
+from array import array
+from collections import OrderedDict, deque, namedtuple
+from contextlib import nullcontext
+from itertools import chain
+
+# faults / hits are totals, log is a list of (page, frames, fault) or None
+PageResult = namedtuple("PageResult", ["faults", "hits", "log"])
+
+# binary trace record header: index, page, fault flag, number of frames;
+# followed by one int64 per resident page
+RECORD = struct.Struct("<QqBI")
+
+
+class ListTracer:
+    """Keeps every traced reference in memory; used for log=True."""
+
+    every = 1
+
+    def __init__(self):
+        self.steps = []
+
+    def record(self, index, page, frames, fault):
+        self.steps.append((page, list(frames), fault))
+
+
+class FileTracer:
+    """Writes traced references to `path` through a large write buffer.
+
+    every=1 traces every reference, every=k only every k-th one (indexes
+    0, k, 2k, ...). fmt="csv" writes "index,page,fault,frames" lines with
+    the frames space-separated; fmt="binary" writes RECORD headers followed
+    by the resident pages as little-endian int64.
+    """
+
+    def __init__(self, path, every=1, fmt="csv", buffer_size=1 << 20):
+        if fmt not in ("csv", "binary"):
+            raise ValueError(f"Unknown trace format: {fmt}")
+        if every < 1:
+            raise ValueError("Sampling interval must be at least 1")
+        self.every = every
+        self.fmt = fmt
+        if fmt == "csv":
+            self.file = open(path, "w", buffering=buffer_size)
+            self.file.write("index,page,fault,frames\n")
+        else:
+            self.file = open(path, "wb", buffering=buffer_size)
+
+    def record(self, index, page, frames, fault):
+        if self.fmt == "csv":
+            self.file.write(f"{index},{page},{int(fault)},{' '.join(map(str, frames))}\n")
+            return
+        frames = array("q", frames)
+        if sys.byteorder != "little":
+            frames.byteswap()
+        self.file.write(RECORD.pack(index, page, fault, len(frames)))
+        self.file.write(frames.tobytes())
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def make_tracer(level, path=None, every=1000, fmt="csv"):
+    """Return the tracer for `level`: "off", "sampled" or "full".
+
+    Every level can be used as `with make_tracer(...) as tracer:`; for
+    "off" that gives tracer = None, and passing the "off" object itself as
+    `tracer=` also disables tracing.
+    """
+    if level == "off":
+        return nullcontext()
+    if level == "sampled":
+        return FileTracer(path, every, fmt)
+    if level == "full":
+        return FileTracer(path, 1, fmt)
+    raise ValueError(f"Unknown trace level: {level}")
+
+
+def read_binary_log(path):
+    """Yield (index, page, fault, frames) from a binary FileTracer output."""
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            index, page, fault, count = RECORD.unpack(header)
+            frames = array("q", f.read(8 * count))
+            if sys.byteorder != "little":
+                frames.byteswap()
+            yield index, page, bool(fault), frames.tolist()
+
+
+def _start_trace(log, tracer):
+    if tracer is not None and not isinstance(tracer, nullcontext):
+        return tracer
+    return ListTracer() if log else None
+
+
+def fifo(pages, frame_size, log=False, tracer=None):
+    """Simulate FIFO replacement over the reference string `pages`.
+
+    Resident pages are kept in a deque in load order with a set for
+    membership, so each reference is O(1). If `log` is true, frames in the
+    log are listed oldest first, as in the standalone script.
+    """
+    queue = deque()
+    resident = set()
+    trace = _start_trace(log, tracer)
+    page_faults = 0
+    references = 0
+
+    for page in pages:
+        references += 1
+        if page in resident:
+            fault = False
+        else:
+            # Page Fault occurs
+            page_faults += 1
+            fault = True
+            if len(queue) >= frame_size:
+                resident.discard(queue.popleft())  # Remove the oldest page
+            queue.append(page)
+            resident.add(page)
+
+        if trace is not None and (references - 1) % trace.every == 0:
+            trace.record(references - 1, page, queue, fault)
+
+    return PageResult(page_faults, references - page_faults, getattr(trace, "steps", None))
+
+
+def lru(pages, frame_size, log=False, tracer=None):
+    """Simulate LRU replacement over the reference string `pages`.
+
+    The resident pages live in an OrderedDict kept in recency order
+    (least recently used first), so a hit is a move_to_end() and an
+    eviction is a popitem(last=False): both O(1).
+
+    If `log` is true a per-reference log is returned as well; each entry is
+    (page, frames, fault) where frames lists the resident pages from least
+    to most recently used. Only use it on small inputs.
+    """
+    frames = OrderedDict()
+    trace = _start_trace(log, tracer)
+    page_faults = 0
+    references = 0
+
+    for page in pages:
+        references += 1
+        if page in frames:
+            # Page Hit: page becomes the most recently used
+            frames.move_to_end(page)
+            fault = False
+        else:
+            # Page Fault
+            page_faults += 1
+            fault = True
+            if len(frames) >= frame_size:
+                # Frame full → remove least recently used page
+                frames.popitem(last=False)
+            frames[page] = None
+
+        if trace is not None and (references - 1) % trace.every == 0:
+            trace.record(references - 1, page, frames, fault)
+
+    return PageResult(page_faults, references - page_faults, getattr(trace, "steps", None))
+
+
+def next_use_index(pages):
+    """Return an array where entry i is the position of the next reference
+    to pages[i], or len(pages) + i when the page is never used again.
+
+    Built in one backward pass, so every key is distinct and can be used
+    directly as a heap priority.
+    """
+    n = len(pages)
+    next_use = array("q", bytes(8 * n))
+    seen = {}
+    for i in range(n - 1, -1, -1):
+        page = pages[i]
+        next_use[i] = seen.get(page, n + i)
+        seen[page] = i
+    return next_use
+
+
+def optimal(pages, frame_size, log=False, tracer=None):
+    """Simulate Optimal (Belady) replacement over the reference string `pages`.
+
+    The next occurrence of every reference is precomputed, and resident
+    pages sit in a max-heap keyed on their next use, so the victim (the page
+    used farthest in the future) is found in O(log frames). A hit leaves a
+    stale heap entry behind; those are skipped when popped and the heap is
+    compacted once it grows past twice the frame count.
+
+    `pages` must support len() and indexing (a list or a memoryview from
+    map_binary_trace(), not a generator); the next-use array costs 8 bytes
+    per reference. If `log` is true, frames in the log keep their slot
+    positions, as in the standalone script.
+    """
+    next_use = next_use_index(pages)
+    resident = {}   # page -> next use key currently in the heap
+    slot = {}       # page -> position in frames (only kept when tracing)
+    frames = []
+    heap = []       # (-next use, page)
+    trace = _start_trace(log, tracer)
+    page_faults = 0
+
+    for i in range(len(pages)):
+        page = pages[i]
+        key = next_use[i]
+
+        if page in resident:
+            fault = False
+        else:
+            page_faults += 1
+            fault = True
+            if len(resident) >= frame_size:
+                # Pop until we reach a live entry: that is the farthest next use
+                while True:
+                    neg_key, victim = heapq.heappop(heap)
+                    if resident.get(victim) == -neg_key:
+                        break
+                del resident[victim]
+                if trace is not None:
+                    index = slot.pop(victim)
+                    frames[index] = page
+                    slot[page] = index
+            elif trace is not None:
+                slot[page] = len(frames)
+                frames.append(page)
+
+        resident[page] = key
+        heapq.heappush(heap, (-key, page))
+        if len(heap) > 2 * frame_size:
+            # Drop stale entries left behind by hits
+            heap = [(k, p) for k, p in heap if resident.get(p) == -k]
+            heapq.heapify(heap)
+
+        if trace is not None and i % trace.every == 0:
+            trace.record(i, page, frames, fault)
+
+    return PageResult(page_faults, len(pages) - page_faults, getattr(trace, "steps", None))
+
+
+def clock(pages, frame_size, log=False, tracer=None):
+    """Simulate CLOCK (second chance) replacement over the reference string `pages`.
+
+    Frames form a fixed circular buffer with one reference bit per slot.
+    A hit only sets the page's bit. On a fault the hand sweeps forward,
+    clearing set bits, and replaces the first page whose bit is already
+    clear. Each bit is cleared at most once per time it is set, so this is
+    O(1) amortized per reference. Frames in the log keep their slot
+    positions.
+    """
+    frames = [None] * frame_size
+    referenced = bytearray(frame_size)
+    slot = {}       # page -> position in frames
+    hand = 0
+    used = 0
+    trace = _start_trace(log, tracer)
+    page_faults = 0
+    references = 0
+
+    for page in pages:
+        references += 1
+        index = slot.get(page)
+        if index is not None:
+            # Page Hit: give it a second chance
+            referenced[index] = 1
+            fault = False
+        else:
+            page_faults += 1
+            fault = True
+            if used < frame_size:
+                index = used
+                used += 1
+            else:
+                while referenced[hand]:
+                    referenced[hand] = 0
+                    hand = (hand + 1) % frame_size
+                index = hand
+                del slot[frames[index]]
+                hand = (hand + 1) % frame_size
+            frames[index] = page
+            referenced[index] = 1
+            slot[page] = index
+
+        if trace is not None and (references - 1) % trace.every == 0:
+            trace.record(references - 1, page, frames[:used], fault)
+
+    return PageResult(page_faults, references - page_faults, getattr(trace, "steps", None))
+
+
+def arc(pages, frame_size, log=False, tracer=None):
+    """Simulate ARC (Adaptive Replacement Cache) over the reference string `pages`.
+
+    T1 holds pages seen once recently and T2 pages seen at least twice;
+    B1 and B2 are ghost lists that remember pages recently evicted from
+    each. A hit in a ghost list moves the target size p of T1 towards the
+    list that would have kept the page (Megiddo and Modha, FAST 2003). All
+    four lists are OrderedDicts in LRU order, so each reference is O(1).
+    Frames in the log are T1 then T2, each from least to most recently used.
+    """
+    t1, t2, b1, b2 = OrderedDict(), OrderedDict(), OrderedDict(), OrderedDict()
+    c = frame_size
+    p = 0           # target size of T1
+    trace = _start_trace(log, tracer)
+    page_faults = 0
+    references = 0
+
+    def replace(in_b2):
+        # Evict from T1 or T2 into the matching ghost list
+        if t1 and (len(t1) > p or (in_b2 and len(t1) == p)):
+            b1[t1.popitem(last=False)[0]] = None
+        else:
+            b2[t2.popitem(last=False)[0]] = None
+
+    for page in pages:
+        references += 1
+        if page in t1 or page in t2:
+            # Page Hit: now seen at least twice
+            if page in t1:
+                del t1[page]
+            else:
+                del t2[page]
+            t2[page] = None
+            fault = False
+        else:
+            page_faults += 1
+            fault = True
+            if page in b1:
+                # Recency would have helped: grow T1's target
+                p = min(c, p + max(len(b2) / len(b1), 1))
+                replace(False)
+                del b1[page]
+                t2[page] = None
+            elif page in b2:
+                # Frequency would have helped: shrink T1's target
+                p = max(0, p - max(len(b1) / len(b2), 1))
+                replace(True)
+                del b2[page]
+                t2[page] = None
+            else:
+                if len(t1) + len(b1) == c:
+                    if len(t1) < c:
+                        b1.popitem(last=False)
+                        replace(False)
+                    else:
+                        t1.popitem(last=False)
+                else:
+                    total = len(t1) + len(t2) + len(b1) + len(b2)
+                    if total >= c:
+                        if total == 2 * c:
+                            b2.popitem(last=False)
+                        replace(False)
+                t1[page] = None
+
+        if trace is not None and (references - 1) % trace.every == 0:
+            trace.record(references - 1, page, chain(t1, t2), fault)
+
+    return PageResult(page_faults, references - page_faults, getattr(trace, "steps", None))
+
+
+def print_result(result):
+    """Print a result in the same table layout as the standalone scripts."""
+    print("------------------------------------------------------")
+    print("Ref Page | Frames (after insertion) | Page Fault?")
+    print("------------------------------------------------------")
+    for page, frames, fault in result.log or []:
+        print(f"{page:^9}|{str(frames):^27}|{('Yes' if fault else 'No'):^12}")
+    print("------------------------------------------------------")
+    print(f"Total Page Faults: {result.faults}")
+    print(f"Total Page Hits  : {result.hits}")
+    print("------------------------------------------------------")
+
+
+if __name__ == "__main__":
+    # Sample Input
+    pages = [2, 3, 2, 1, 5, 2, 4, 5, 3, 2, 5, 2]
+    frame_size = 3
+
+    print("FIFO")
+    print_result(fifo(pages, frame_size, log=True))
+
+    print("\nLRU")
+    print_result(lru(pages, frame_size, log=True))
+
+    print("\nOptimal")
+    print_result(optimal(pages, frame_size, log=True))
+
+    print("\nCLOCK (Second Chance)")
+    print_result(clock(pages, frame_size, log=True))
+
+    print("\nARC")
+    print_result(arc(pages, frame_size, log=True))
+
+    # Full tracing to a file instead of the console:
+    #   with make_tracer("full", "lru_trace.csv") as tracer:
+    #       lru(pages, frame_size, tracer=tracer)
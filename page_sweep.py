@@ -0,0 +1,108 @@
+# Program: Parallel Page Replacement Policy Sweep
+# Author: Example Solution
+# Runs every (policy, trace, frame size) combination across CPU cores and
+# collects the fault counts into one table.
+
+# Traces are never pickled per job. An in-memory trace is copied once into
+# a shared memory block that every worker maps; a path is taken to be a
+# binary trace file (see reference_trace.py), which each worker memory-maps
+# itself. Workers attach to all traces once, in the pool initializer, and
+# jobs only carry (policy, trace name, frame size).
+
+import os
+import sys
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from page_replacement import arc, clock, fifo, lru, optimal
+from reference_trace import map_binary_trace
+
+POLICIES = {"FIFO": fifo, "LRU": lru, "Optimal": optimal, "CLOCK": clock, "ARC": arc}
+
+SweepRow = namedtuple("SweepRow", ["policy", "trace", "frame_size", "references",
+                                   "faults", "hits", "fault_rate"])
+
+# worker-side state: trace name -> memoryview, plus the blocks keeping them alive
+_TRACES = {}
+_BLOCKS = []
+
+
+def _attach(sources):
+    for name, kind, where, length in sources:
+        if kind == "shm":
+            block = shared_memory.SharedMemory(name=where)
+            _BLOCKS.append(block)
+            _TRACES[name] = block.buf[:length * 8].cast("q")
+        else:
+            _TRACES[name] = map_binary_trace(where)
+
+
+def _run(job):
+    policy, name, frame_size = job
+    pages = _TRACES[name]
+    result = POLICIES[policy](pages, frame_size)
+    references = result.faults + result.hits
+    return SweepRow(policy, name, frame_size, references, result.faults, result.hits,
+                    result.faults / references if references else 0.0)
+
+
+def sweep(traces, frame_sizes, policies=("FIFO", "LRU", "Optimal"), workers=None):
+    """Run every policy on every trace for every frame size, in parallel.
+
+    `traces` maps a trace name to a sequence of page numbers or to the path
+    of a binary trace file. Returns a list of SweepRow, one per
+    (policy, trace, frame size) job, in that nesting order.
+    """
+    for policy in policies:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy: {policy}")
+
+    blocks = []
+    sources = []
+    try:
+        for name, trace in traces.items():
+            if isinstance(trace, (str, os.PathLike)):
+                sources.append((name, "file", os.fspath(trace), 0))
+                continue
+            pages = array("q", trace)
+            block = shared_memory.SharedMemory(create=True, size=max(len(pages) * 8, 1))
+            blocks.append(block)
+            block.buf[:len(pages) * 8] = pages.tobytes()
+            sources.append((name, "shm", block.name, len(pages)))
+
+        jobs = [(policy, name, frame_size)
+                for policy in policies
+                for name in traces
+                for frame_size in frame_sizes]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach,
+                                 initargs=(sources,)) as pool:
+            return list(pool.map(_run, jobs))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def print_sweep(rows):
+    print("----------------------------------------------------------------------")
+    print(" Policy  |      Trace      | Frames | References | Faults | Fault Rate")
+    print("----------------------------------------------------------------------")
+    for r in rows:
+        print(f"{r.policy:^9}|{r.trace:^17}|{r.frame_size:^8}|{r.references:^12}|{r.faults:^8}|{r.fault_rate:^11.2%}")
+    print("----------------------------------------------------------------------")
+
+
+if __name__ == "__main__":
+    # Sample Input: the scripts' reference string plus any binary traces
+    # given on the command line
+    traces = {"sample": [2, 3, 2, 1, 5, 2, 4, 5, 3, 2, 5, 2]}
+    for path in sys.argv[1:]:
+        traces[os.path.basename(path)] = path
+
+    started = time.perf_counter()
+    rows = sweep(traces, frame_sizes=[1, 2, 3, 4, 5])
+    print_sweep(rows)
+    print(f"{len(rows)} runs in {time.perf_counter() - started:.2f}s")
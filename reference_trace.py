@@ -0,0 +1,105 @@
+# Program: Page Reference Trace I/O
+# Author: Example Solution
+# Streams text traces and memory-maps a compact binary trace format, so the
+# page replacement engines never need the whole reference string as a list.
+
+# Binary trace layout (little-endian):
+#   bytes 0-3   magic b"PGTR"
+#   byte  4     format version (1)
+#   byte  5     width of one reference in bytes (4 = uint32, 8 = uint64)
+#   bytes 6-7   reserved (zero)
+#   bytes 8-    the page numbers, packed back to back
+
+import mmap
+import re
+import sys
+from array import array
+
+MAGIC = b"PGTR"
+VERSION = 1
+HEADER_SIZE = 8
+TYPECODES = {4: "I", 8: "Q"}
+
+
+def read_text_trace(path):
+    """Yield page numbers from a text trace one at a time.
+
+    Numbers may be separated by whitespace or commas and span any number of
+    lines; anything after '#' on a line is a comment.
+    """
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0]
+            for tok in re.split(r"[\s,]+", line):
+                if tok:
+                    yield int(tok)
+
+
+def write_binary_trace(path, pages, width=4):
+    """Write the page numbers from the iterable `pages` as a binary trace.
+
+    Pages are packed in chunks, so `pages` can be a generator over a trace
+    of any length. Returns the number of references written.
+    """
+    if width not in TYPECODES:
+        raise ValueError(f"Unsupported reference width: {width}")
+    typecode = TYPECODES[width]
+    count = 0
+    with open(path, "wb") as f:
+        f.write(MAGIC + bytes([VERSION, width, 0, 0]))
+        chunk = array(typecode)
+        for page in pages:
+            chunk.append(page)
+            if len(chunk) == 65536:
+                count += _write_chunk(f, chunk)
+                chunk = array(typecode)
+        count += _write_chunk(f, chunk)
+    return count
+
+
+def _write_chunk(f, chunk):
+    if sys.byteorder != "little":
+        chunk.byteswap()
+    chunk.tofile(f)
+    return len(chunk)
+
+
+def map_binary_trace(path):
+    """Memory-map a binary trace and return it as a read-only memoryview of ints.
+
+    The view supports len(), indexing and iteration, so it can be passed
+    straight to fifo(), lru() and optimal(); pages are read from the mapped
+    file on demand and the mapping is released with the last reference to
+    the view.
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE or header[:4] != MAGIC:
+            raise ValueError(f"Not a binary page trace: {path}")
+        if header[4] != VERSION:
+            raise ValueError(f"Unsupported trace version: {header[4]}")
+        width = header[5]
+        if width not in TYPECODES:
+            raise ValueError(f"Unsupported reference width: {width}")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    body = memoryview(mapped)[HEADER_SIZE:]
+    if len(body) % width:
+        raise ValueError(f"Truncated binary page trace: {path}")
+    if sys.byteorder != "little":
+        # Big-endian host: fall back to a byte-swapped in-memory copy
+        pages = array(TYPECODES[width], body)
+        pages.byteswap()
+        return memoryview(pages)
+    return body.cast(TYPECODES[width])
+
+
+if __name__ == "__main__":
+    # Convert a text trace to the binary format:
+    #   python reference_trace.py trace.txt trace.bin [4|8]
+    if len(sys.argv) < 3:
+        print("usage: python reference_trace.py <text trace> <binary trace> [width]")
+        sys.exit(1)
+    width = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    count = write_binary_trace(sys.argv[2], read_text_trace(sys.argv[1]), width)
+    print(f"Wrote {count} references to {sys.argv[2]}")
@@ -0,0 +1,97 @@
+# Program: LRU Stack Distance Analyzer (Mattson's stack algorithm)
+# Author: Example Solution
+# One pass over the reference string gives LRU page faults for every frame count.
+
+# The stack distance of a reference is the number of distinct pages touched
+# since the previous reference to the same page (counting the page itself).
+# Under LRU a reference hits with `frames` frames exactly when its stack
+# distance is <= frames, so a histogram of distances is enough to get the
+# whole faults-vs-frames curve.
+#
+# Distances are counted with a Fenwick (binary indexed) tree over time:
+# position t holds 1 while t is the latest reference to some page, so the
+# distance is a range sum between the previous and current reference.
+
+
+class FenwickTree:
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index, delta):
+        # index is 0-based
+        index += 1
+        while index <= self.size:
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index):
+        # sum of positions 0 .. index-1
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+
+def stack_distances(pages):
+    """Return (histogram, cold_misses) for the reference string `pages`.
+
+    histogram[d] is the number of references with stack distance d
+    (index 0 is unused); cold_misses counts first references, whose
+    distance is infinite. Runs in O(n log n).
+    """
+    n = len(pages)
+    tree = FenwickTree(n)
+    last_seen = {}
+    histogram = [0]
+    cold_misses = 0
+
+    for t in range(n):
+        page = pages[t]
+        prev = last_seen.get(page)
+        if prev is None:
+            cold_misses += 1
+        else:
+            # distinct pages referenced after prev, plus the page itself
+            distance = tree.prefix_sum(t) - tree.prefix_sum(prev + 1) + 1
+            while len(histogram) <= distance:
+                histogram.append(0)
+            histogram[distance] += 1
+            tree.add(prev, -1)
+        tree.add(t, 1)
+        last_seen[page] = t
+
+    return histogram, cold_misses
+
+
+def fault_curve(pages, max_frames=None):
+    """Return a list where entry k-1 is the LRU page fault count with k frames.
+
+    The curve runs from 1 frame up to `max_frames` (by default the number of
+    distinct pages, beyond which only cold misses remain).
+    """
+    histogram, cold_misses = stack_distances(pages)
+    if max_frames is None:
+        max_frames = max(cold_misses, 1)
+
+    # faults(k) = cold misses + references with distance > k
+    curve = []
+    beyond = sum(histogram)
+    for frames in range(1, max_frames + 1):
+        if frames < len(histogram):
+            beyond -= histogram[frames]
+        curve.append(cold_misses + beyond)
+    return curve
+
+
+if __name__ == "__main__":
+    # Sample Input
+    pages = [2, 3, 2, 1, 5, 2, 4, 5, 3, 2, 5, 2]
+
+    print("------------------------------")
+    print("Frames | Page Faults | Page Hits")
+    print("------------------------------")
+    for frames, faults in enumerate(fault_curve(pages), start=1):
+        print(f"{frames:^7}|{faults:^13}|{len(pages) - faults:^10}")
+    print("------------------------------")
@@ -0,0 +1,132 @@
+# Program: Working Set and Page Fault Frequency Analyzer
+# Author: Example Solution
+# Working-set size W(t, delta) over time and window sizes, from one pass
+# over the reference string.
+
+# W(t, delta) is the number of distinct pages among the `delta` references
+# ending at time t. A working-set policy with window delta faults on a
+# reference whose page was not used in the previous delta references, so
+# its fault rate is the page fault frequency for that window.
+#
+# Both come from the per-page last-reference index:
+#   * the gap back to a page's previous reference decides whether it
+#     enters the window (gap >= delta) and whether it faults (gap > delta);
+#   * a reference that slides out of the window takes its page with it
+#     only if that was still the page's latest reference.
+
+from collections import namedtuple
+
+WorkingSetPoint = namedtuple("WorkingSetPoint", ["delta", "avg_size", "faults", "fault_rate"])
+
+
+def working_set_series(pages, deltas, sample_every=1):
+    """Track W(t, delta) for several window sizes in one streaming pass.
+
+    `pages` can be any iterable (e.g. a generator over a text trace). Only
+    the last max(deltas) references are buffered. Returns
+    (samples, points): samples is a list of (t, sizes) taken every
+    `sample_every` references, with sizes in the order of sorted(deltas),
+    and points holds one WorkingSetPoint per delta. O(n x len(deltas)).
+    """
+    deltas = sorted(set(deltas))
+    if not deltas or deltas[0] < 1:
+        raise ValueError("Window sizes must be positive")
+    span = deltas[-1]
+    window = [None] * span      # page of reference t sits at window[t % span]
+    last = {}                   # page -> time of its latest reference
+    sizes = [0] * len(deltas)
+    totals = [0] * len(deltas)
+    faults = [0] * len(deltas)
+    samples = []
+    t = -1
+
+    for t, page in enumerate(pages):
+        prev = last.get(page)
+        gap = None if prev is None else t - prev
+        for k, delta in enumerate(deltas):
+            if t >= delta:
+                # reference t - delta slides out of the window
+                old = window[(t - delta) % span]
+                if last[old] == t - delta:
+                    sizes[k] -= 1
+            if gap is None or gap >= delta:
+                sizes[k] += 1
+            if gap is None or gap > delta:
+                faults[k] += 1
+            totals[k] += sizes[k]
+        window[t % span] = page
+        last[page] = t
+        if t % sample_every == 0:
+            samples.append((t, tuple(sizes)))
+
+    n = t + 1
+    points = [WorkingSetPoint(delta, totals[k] / n if n else 0.0, faults[k],
+                              faults[k] / n if n else 0.0)
+              for k, delta in enumerate(deltas)]
+    return samples, points
+
+
+def working_set_curve(pages, max_delta):
+    """Average working-set size and fault rate for every delta in 1..max_delta.
+
+    One pass builds histograms of the gaps between references to the same
+    page; every window size is then read off cumulative sums, so the cost
+    is O(n + max_delta) rather than one pass per delta. Returns a list of
+    WorkingSetPoint, one per delta.
+    """
+    # back[g]: references whose previous use was g references earlier
+    # ahead[h]: references that stay the latest use of their page for h steps
+    back = [0] * (max_delta + 2)
+    ahead = [0] * (max_delta + 2)
+    first_refs = 0
+    last = {}
+    n = 0
+
+    for t, page in enumerate(pages):
+        prev = last.get(page)
+        if prev is None:
+            first_refs += 1
+        else:
+            gap = min(t - prev, max_delta + 1)
+            back[gap] += 1
+            ahead[gap] += 1
+        last[page] = t
+        n = t + 1
+    for prev in last.values():
+        ahead[min(n - prev, max_delta + 1)] += 1
+
+    points = []
+    total = 0               # sum over t of W(t, delta)
+    at_least = n            # references that stay latest for >= delta steps
+    beyond = n - first_refs  # repeat references with gap > delta
+    for delta in range(1, max_delta + 1):
+        total += at_least
+        at_least -= ahead[delta]
+        beyond -= back[delta]
+        fault_count = first_refs + beyond
+        points.append(WorkingSetPoint(delta, total / n if n else 0.0, fault_count,
+                                      fault_count / n if n else 0.0))
+    return points
+
+
+def print_curve(points):
+    print("---------------------------------------------------")
+    print(" Window | Avg Working Set | Faults | Fault Rate")
+    print("---------------------------------------------------")
+    for p in points:
+        print(f"{p.delta:^8}|{p.avg_size:^17.2f}|{p.faults:^8}|{p.fault_rate:^11.2%}")
+    print("---------------------------------------------------")
+
+
+if __name__ == "__main__":
+    # Sample Input
+    pages = [2, 3, 2, 1, 5, 2, 4, 5, 3, 2, 5, 2]
+
+    print_curve(working_set_curve(pages, 6))
+
+    deltas = [2, 3, 4]
+    samples, _ = working_set_series(pages, deltas)
+    print("\n  t  | Page | " + " | ".join(f"W(t,{d})" for d in deltas))
+    print("---------------------------------")
+    for t, sizes in samples:
+        print(f"{t:^5}|{pages[t]:^6}| " + " | ".join(f"{s:^6}" for s in sizes))